@@ -0,0 +1,204 @@
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+class ConfigError(ValueError):
+    """Raised when the configuration file is missing values or has invalid ones."""
+
+
+@dataclass
+class ApiConfig:
+    """API connection settings."""
+    base_url: str
+    api_key: str
+    model: str
+
+
+@dataclass
+class ProcessingConfig:
+    """What to do with the input files and how to write the results."""
+    mode: str
+    file_types: List[str] = field(default_factory=lambda: ['pdf'])
+    pdf_method: str = 'extract'
+    fast_text_only: bool = False
+    output_language: str = 'English'
+    output_format: str = 'docx'
+    batch_mode: bool = False
+
+    def __post_init__(self):
+        valid_modes = ['translate', 'summarize', 'both']
+        if self.mode not in valid_modes:
+            raise ConfigError(f"Invalid processing mode '{self.mode}'. Must be one of {valid_modes}")
+
+        valid_formats = ['docx', 'tex', 'txt', 'md']
+        if self.output_format.lower() not in valid_formats:
+            raise ConfigError(f"Invalid output format '{self.output_format}'. Must be one of {valid_formats}")
+
+
+@dataclass
+class PathsConfig:
+    """Input and output directories."""
+    input_dir: str
+    translate_dir: str = 'translates'
+    summarize_dir: str = 'summarizations'
+
+
+@dataclass
+class PromptsConfig:
+    """Prompt templates (placeholders: {content}, {output_language})."""
+    translation: Optional[str] = None
+    summarization: Optional[str] = None
+
+
+@dataclass
+class SemanticCacheConfig:
+    """Embedding-similarity response cache settings."""
+    enabled: bool = False
+    embedding_model: str = 'text-embedding-3-small'
+    similarity_threshold: float = 0.92
+
+
+@dataclass
+class RetryConfig:
+    """Retry settings for transient API errors."""
+    max_attempts: int = 6
+    max_wait: float = 60
+
+
+@dataclass
+class AdvancedConfig:
+    """Tuning and behaviour settings."""
+    max_tokens: int = 16000
+    temperature: float = 0.3
+    max_content_chars: int = 0
+    timeout: int = 300
+    retry: RetryConfig = field(default_factory=RetryConfig)
+    show_progress: bool = True
+    continue_on_error: bool = True
+    show_timing: bool = True
+    skip_existing: bool = True
+    chunk_chars: int = 6000
+    stream_output: bool = False
+    max_concurrency: int = 4
+    max_concurrent_requests: int = 8
+    extract_workers: int = 2
+    extract_processes: int = 0
+    write_workers: int = 2
+    max_keepalive_connections: int = 20
+    max_connections: int = 100
+    cache_enabled: bool = True
+    cache_dir: str = '.llm_cache'
+    extraction_cache: bool = False
+    semantic_cache: SemanticCacheConfig = field(default_factory=SemanticCacheConfig)
+
+    def __post_init__(self):
+        for name in ('max_concurrency', 'max_concurrent_requests', 'extract_workers', 'write_workers', 'max_connections'):
+            if getattr(self, name) < 1:
+                raise ConfigError(f"advanced.{name} must be at least 1")
+
+
+@dataclass
+class AppConfig:
+    """Complete application configuration."""
+    api: ApiConfig
+    processing: ProcessingConfig
+    paths: PathsConfig
+    prompts: PromptsConfig = field(default_factory=PromptsConfig)
+    formatting: Dict[str, Any] = field(default_factory=dict)
+    advanced: AdvancedConfig = field(default_factory=AdvancedConfig)
+
+    def __post_init__(self):
+        # Every enabled task needs its prompt
+        mode = self.processing.mode
+        if mode in ['translate', 'both'] and not self.prompts.translation:
+            raise ConfigError("Missing required configuration: prompts.translation")
+        if mode in ['summarize', 'both'] and not self.prompts.summarization:
+            raise ConfigError("Missing required configuration: prompts.summarization")
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "AppConfig":
+        """
+        Build and validate the configuration from a parsed YAML document.
+
+        Args:
+            data: Configuration dictionary
+
+        Returns:
+            Validated AppConfig
+
+        Raises:
+            ConfigError: If required values are missing or values are invalid
+        """
+        return _build(cls, data or {}, "")
+
+
+def _build(cls, data: Any, prefix: str):
+    """
+    Recursively build a config dataclass from a dictionary.
+
+    Args:
+        cls: Dataclass to build
+        data: Dictionary with the section's values
+        prefix: Dotted path of the section (for error messages)
+
+    Returns:
+        Instance of cls
+    """
+    if not isinstance(data, dict):
+        raise ConfigError(f"Configuration section '{prefix.rstrip('.')}' must be a mapping")
+
+    fields = {f.name: f for f in dataclasses.fields(cls)}
+
+    # Unknown keys (typos, or settings of other versions) are reported but not fatal
+    for key in data:
+        if key not in fields:
+            print(f"Warning: Ignoring unknown configuration key: {prefix}{key}")
+
+    kwargs = {}
+    for name, f in fields.items():
+        if name not in data or data[name] is None:
+            if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING:
+                raise ConfigError(f"Missing required configuration: {prefix}{name}")
+            continue
+
+        value = data[name]
+        if dataclasses.is_dataclass(f.type):
+            value = _build(f.type, value, f"{prefix}{name}.")
+        elif f.type in _SCALAR_TYPES:
+            value = _check_scalar(f.type, value, f"{prefix}{name}")
+        kwargs[name] = value
+
+    return cls(**kwargs)
+
+
+_SCALAR_TYPES = {str: "a string", bool: "true or false", int: "an integer", float: "a number"}
+
+
+def _check_scalar(expected: type, value: Any, name: str):
+    """
+    Check the type of a scalar configuration value.
+
+    Args:
+        expected: Type declared for the field (str, bool, int or float)
+        value: Value read from the configuration file
+        name: Dotted name of the value (for error messages)
+
+    Returns:
+        The value, as a float for float fields given an integer
+
+    Raises:
+        ConfigError: If the value has the wrong type
+    """
+    # bool is a subclass of int, but "max_tokens: yes" is almost certainly a mistake
+    if expected is not bool and isinstance(value, bool):
+        valid = False
+    elif expected is float:
+        valid = isinstance(value, (int, float))
+        value = float(value) if valid else value
+    else:
+        valid = isinstance(value, expected)
+
+    if not valid:
+        raise ConfigError(f"{name} must be {_SCALAR_TYPES[expected]}, got {value!r}")
+    return value
@@ -0,0 +1,333 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency, only needed for the semantic cache
+    np = None
+
+
+class LLMCache:
+    """On-disk cache of LLM responses keyed by a hash of the request."""
+
+    def __init__(self, cache_dir: str = ".llm_cache", enabled: bool = True):
+        """
+        Initialize LLM response cache.
+
+        Args:
+            cache_dir: Directory where cached responses are stored
+            enabled: Whether caching is enabled
+        """
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        Build a deterministic cache key for a request.
+
+        Args:
+            model: Model name
+            prompt: Fully formatted prompt
+            temperature: Temperature for generation
+            max_tokens: Maximum tokens for response
+
+        Returns:
+            SHA-256 hex digest of the request payload
+        """
+        payload = json.dumps({
+            'model': model,
+            'prompt': prompt,
+            'temperature': temperature,
+            'max_tokens': max_tokens
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """
+        Check whether responses for a request can be cached.
+
+        Sampling with temperature > 0 is not deterministic, so those
+        responses are never cached.
+
+        Args:
+            temperature: Temperature for generation
+
+        Returns:
+            True if the response may be cached
+        """
+        return self.enabled and temperature <= 0
+
+    def _path_for(self, key: str) -> Path:
+        """Return the file path for a cache key (sharded by the first two hex chars)."""
+        return self.cache_dir / key[:2] / f"{key}.txt"
+
+    def read(self, key: str) -> Optional[str]:
+        """
+        Read a cached response without updating hit/miss statistics.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Cached response text or None if not present
+        """
+        try:
+            with open(self._path_for(key), 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"Warning: Could not read LLM cache entry {key}: {str(e)}")
+            return None
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Cached response text or None on a miss
+        """
+        response = self.read(key)
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return response
+
+    def set(self, key: str, response: str):
+        """
+        Store a response in the cache.
+
+        The entry is written to a temporary file and moved into place so a
+        concurrent reader never sees a partially written response.
+
+        Args:
+            key: Cache key from cache_key()
+            response: Response text to store
+        """
+        path = self._path_for(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(response)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            print(f"Warning: Could not write LLM cache entry {key}: {str(e)}")
+
+
+def _atomic_write(path: Path, write_func):
+    """
+    Write a file through a temporary file and move it into place.
+
+    Args:
+        path: Destination path
+        write_func: Callable receiving a binary file object
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write_func(f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class _ScopeIndex:
+    """Vectors and cache keys of one scope: rows memory-mapped from disk plus rows added since."""
+
+    def __init__(self, dim: int, stored: Optional["np.ndarray"], keys: List[str]):
+        self.dim = dim
+        self.stored = stored
+        # Grown by doubling, so adding a row is amortized O(1)
+        self.added = np.empty((16, dim), dtype=np.float32)
+        self.num_added = 0
+        self.keys = keys
+
+    def append(self, vector: "np.ndarray", key: str):
+        """Add a normalized vector and its cache key."""
+        if self.num_added == len(self.added):
+            grown = np.empty((2 * len(self.added), self.dim), dtype=np.float32)
+            grown[:self.num_added] = self.added
+            self.added = grown
+        self.added[self.num_added] = vector
+        self.num_added += 1
+        self.keys.append(key)
+
+    def scores(self, query: "np.ndarray") -> Optional["np.ndarray"]:
+        """Cosine similarity of the query to every row, in key order (None if empty)."""
+        parts = []
+        if self.stored is not None:
+            parts.append(self.stored @ query)
+        if self.num_added:
+            parts.append(self.added[:self.num_added] @ query)
+        return np.concatenate(parts) if parts else None
+
+
+class SemanticCache:
+    """Embedding-similarity lookup of responses stored in an LLMCache."""
+
+    def __init__(self, store: LLMCache, embedding_model: str = "text-embedding-3-small",
+                 similarity_threshold: float = 0.92, max_embed_chars: int = 8000):
+        """
+        Initialize semantic cache.
+
+        Args:
+            store: Exact-match cache holding the response texts
+            embedding_model: Model used to embed request content
+            similarity_threshold: Minimum cosine similarity for a hit
+            max_embed_chars: Content is truncated to this many characters before embedding
+        """
+        if np is None:
+            raise ImportError("numpy is required for the semantic cache")
+
+        self.store = store
+        self.embedding_model = embedding_model
+        self.similarity_threshold = similarity_threshold
+        self.max_embed_chars = max_embed_chars
+        self.index_dir = store.cache_dir / "semantic"
+
+        # One index per scope (task type + language + model) and embedding size
+        self._indices: Dict[Tuple[str, int], _ScopeIndex] = {}
+        # add() may run in a worker thread while the event loop does lookups
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+
+    def _index_paths(self, scope: str, dim: int) -> Tuple[Path, Path]:
+        """Return the vector and key file paths for a scope and embedding size."""
+        name = hashlib.sha256(scope.encode('utf-8')).hexdigest()[:16]
+        return self.index_dir / f"{name}-{dim}.f32", self.index_dir / f"{name}-{dim}.keys"
+
+    def _load(self, scope: str, dim: int) -> _ScopeIndex:
+        """
+        Load the index for a scope, memory-mapping the vectors from disk.
+
+        The vector file holds raw float32 rows and the key file one cache key
+        per line, both only ever appended to.
+
+        Args:
+            scope: Cache scope
+            dim: Embedding size
+
+        Returns:
+            Index of the scope
+        """
+        index = self._indices.get((scope, dim))
+        if index is not None:
+            return index
+
+        vectors_path, keys_path = self._index_paths(scope, dim)
+        row_bytes = dim * np.dtype(np.float32).itemsize
+        stored, keys = None, []
+        try:
+            text = keys_path.read_text(encoding='utf-8') if keys_path.exists() else ''
+            # Text after the final newline is a key whose append was interrupted
+            keys = text.split('\n')[:-1]
+            size = vectors_path.stat().st_size if vectors_path.exists() else 0
+            count = min(size // row_bytes, len(keys))
+            if count != len(keys) or count * row_bytes != size or not text.endswith('\n'):
+                # Drop the incomplete entry so later appends stay aligned
+                keys = keys[:count]
+                if size:
+                    os.truncate(vectors_path, count * row_bytes)
+                if keys_path.exists():
+                    _atomic_write(keys_path, lambda f: f.write(''.join(k + '\n' for k in keys).encode('utf-8')))
+            if count:
+                stored = np.memmap(vectors_path, dtype=np.float32, mode='r', shape=(count, dim))
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not load semantic cache index: {str(e)}")
+            stored, keys = None, []
+
+        index = _ScopeIndex(dim, stored, keys)
+        self._indices[(scope, dim)] = index
+        return index
+
+    @staticmethod
+    def _normalize(embedding) -> "np.ndarray":
+        """L2-normalize an embedding so a dot product gives cosine similarity."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def embedding_input(self, content: str) -> str:
+        """Return the (truncated) text that should be embedded for a request."""
+        return content[:self.max_embed_chars]
+
+    def lookup(self, scope: str, embedding) -> Optional[str]:
+        """
+        Find the cached response of the most similar earlier request.
+
+        Args:
+            scope: Cache scope (task type + language + model)
+            embedding: Embedding of the request content
+
+        Returns:
+            Cached response text, or None if nothing is similar enough
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            index = self._load(scope, query.shape[0])
+            scores = index.scores(query)
+            key = None
+            if scores is not None:
+                best = int(np.argmax(scores))
+                if scores[best] >= self.similarity_threshold:
+                    key = index.keys[best]
+
+        if key is not None:
+            response = self.store.read(key)
+            if response is not None:
+                self.hits += 1
+                return response
+
+        self.misses += 1
+        return None
+
+    def add(self, scope: str, embedding, key: str):
+        """
+        Add a request embedding to the index of a scope.
+
+        The entry is appended to the index files, so the cost does not grow
+        with the size of the index.
+
+        Args:
+            scope: Cache scope (task type + language + model)
+            embedding: Embedding of the request content
+            key: Exact-cache key under which the response is stored
+        """
+        query = self._normalize(embedding)
+        with self._lock:
+            index = self._load(scope, query.shape[0])
+            index.append(query, key)
+
+            vectors_path, keys_path = self._index_paths(scope, index.dim)
+            try:
+                self.index_dir.mkdir(parents=True, exist_ok=True)
+                # Vector first: a key is only trusted once its row is complete
+                with open(vectors_path, 'ab') as f:
+                    f.write(query.tobytes())
+                with open(keys_path, 'a', encoding='utf-8') as f:
+                    f.write(key + '\n')
+            except OSError as e:
+                print(f"Warning: Could not write semantic cache index: {str(e)}")
@@ -1,11 +1,140 @@
-from openai import OpenAI
-from typing import Optional, Dict, Any
+import re
+import json
+import time
+import asyncio
+import string
+import hashlib
+import functools
+import httpx
+import openai
+from openai import OpenAI, AsyncOpenAI
+from tenacity import Retrying, AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from typing import Optional, Dict, Any, Iterator, AsyncIterator, List, Tuple
+
+from llm_cache import LLMCache, SemanticCache
+
+
+# SSL context and HTTP clients shared by all LLMClient instances of the process,
+# so constructing another client does not rebuild the SSL context or the pool
+_SSL_CTX = httpx.create_ssl_context()  # certifi bundle, SSL_CERT_FILE / SSL_CERT_DIR
+_HTTPX_CLIENTS: Dict[tuple, httpx.Client] = {}
+_HTTPX_USERS: Dict[tuple, int] = {}
+
+
+@functools.lru_cache(maxsize=32)
+def _split_prompt_template(prompt_template: str, output_language: str) -> Optional[Tuple[str, ...]]:
+    """
+    Pre-format a prompt template for a language, split around its {content} fields.
+
+    Args:
+        prompt_template: Prompt template with placeholders
+        output_language: Target language
+
+    Returns:
+        Tuple of literal parts to be joined with the content, or None if the
+        template uses fields this fast path does not handle
+    """
+    parts = []
+    current = ""
+    for literal, field, spec, conversion in string.Formatter().parse(prompt_template):
+        current += literal
+        if field is None:
+            continue
+        if field == 'output_language':
+            value = output_language if conversion is None else string.Formatter().convert_field(output_language, conversion)
+            current += format(value, spec)
+        elif field == 'content' and not spec and conversion is None:
+            parts.append(current)
+            current = ""
+        else:
+            return None
+    parts.append(current)
+    return tuple(parts)
+
+
+def format_prompt(prompt_template: str, content: str, output_language: str) -> str:
+    """
+    Fill a prompt template with content and output language.
+
+    Equivalent to prompt_template.format(content=..., output_language=...),
+    but the template is only parsed once per (template, language).
+
+    Args:
+        prompt_template: Prompt template with placeholders
+        content: Text content
+        output_language: Target language
+
+    Returns:
+        Formatted prompt
+    """
+    parts = _split_prompt_template(prompt_template, output_language)
+    if parts is None:
+        return prompt_template.format(content=content, output_language=output_language)
+    return content.join(parts)
+
+
+# Transient API errors that are retried with backoff
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError,
+)
+
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+def split_into_chunks(content: str, chunk_chars: int) -> List[str]:
+    """
+    Split content into chunks of at most chunk_chars characters.
+
+    Chunks are built from whole paragraphs; a paragraph longer than
+    chunk_chars is split on sentence boundaries (and, as a last resort,
+    hard-wrapped).
+
+    Args:
+        content: Text content to split
+        chunk_chars: Maximum chunk size in characters
+
+    Returns:
+        List of chunks in document order
+    """
+    # (separator that precedes the piece in the original layout, piece)
+    pieces = []
+    for paragraph in _PARAGRAPH_SPLIT_RE.split(content):
+        if not paragraph.strip():
+            continue
+        if len(paragraph) <= chunk_chars:
+            pieces.append(("\n\n", paragraph))
+            continue
+        separator = "\n\n"
+        for sentence in _SENTENCE_SPLIT_RE.split(paragraph):
+            for start in range(0, len(sentence), chunk_chars):
+                pieces.append((separator, sentence[start:start + chunk_chars]))
+                separator = ""
+            separator = " "
+
+    chunks = []
+    current = ""
+    for separator, piece in pieces:
+        if current and len(current) + len(separator) + len(piece) > chunk_chars:
+            chunks.append(current)
+            current = ""
+        current = current + separator + piece if current else piece
+
+    if current:
+        chunks.append(current)
+
+    return chunks
 
 
 class LLMClient:
     """Handles communication with the LLM API for translation and summarization."""
 
-    def __init__(self, base_url: str, api_key: str, model: str, max_tokens: int = 16000, temperature: float = 0.3, timeout: int = 300):
+    def __init__(self, base_url: str, api_key: str, model: str, max_tokens: int = 16000, temperature: float = 0.3, timeout: int = 300,
+                 max_keepalive_connections: int = 20, max_connections: int = 100, cache: Optional[LLMCache] = None,
+                 semantic_cache: Optional[SemanticCache] = None, retry_max_attempts: int = 6, retry_max_wait: float = 60,
+                 max_concurrent_requests: int = 8):
         """
         Initialize LLM client.
 
@@ -16,28 +145,237 @@ class LLMClient:
             max_tokens: Maximum tokens for response
             temperature: Temperature for generation
             timeout: Request timeout in seconds
+            max_keepalive_connections: Idle connections kept open for reuse
+            max_connections: Maximum number of concurrent connections
+            cache: Optional response cache consulted before calling the API
+            semantic_cache: Optional embedding-similarity cache consulted on exact-cache misses
+            retry_max_attempts: Maximum attempts for a request failing with a transient error
+            retry_max_wait: Maximum wait between attempts in seconds
+            max_concurrent_requests: Maximum number of asynchronous LLM requests in flight
         """
+        # Persistent connection pools so repeated calls reuse warm TLS sessions
+        limits = httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections=max_connections,
+            keepalive_expiry=30.0
+        )
+
+        # The synchronous pool is shared with other clients for the same endpoint
+        # and credentials, and closed when the last of them is closed
+        self._http_key = (base_url, hashlib.sha256(api_key.encode('utf-8')).digest(), timeout,
+                          max_keepalive_connections, max_connections)
+        self._http = _HTTPX_CLIENTS.get(self._http_key)
+        if self._http is None:
+            self._http = httpx.Client(verify=_SSL_CTX, limits=limits, timeout=timeout)
+            _HTTPX_CLIENTS[self._http_key] = self._http
+        _HTTPX_USERS[self._http_key] = _HTTPX_USERS.get(self._http_key, 0) + 1
+        self._http_released = False
+
         self.client = OpenAI(
             base_url=base_url,
             api_key=api_key,
-            timeout=timeout
+            timeout=timeout,
+            http_client=self._http,
+            max_retries=0  # Retries are handled below, with backoff and Retry-After
         )
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+
+        self._async_settings = (base_url, api_key, timeout, limits, max_concurrent_requests)
+        self._open_async()
 
-    def _call_llm(self, prompt: str) -> Optional[str]:
+        # Exponential backoff with jitter on rate limits, timeouts and 5xx errors
+        self._backoff = wait_exponential_jitter(initial=1, max=retry_max_wait)
+        self._retry_max_wait = retry_max_wait
+        self._retry_kwargs = dict(
+            retry=retry_if_exception_type(RETRYABLE_ERRORS),
+            wait=self._retry_wait,
+            stop=stop_after_attempt(retry_max_attempts),
+            before_sleep=self._log_retry,
+            reraise=True
+        )
+
+    def _retry_wait(self, retry_state) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Honors the Retry-After header of the failed response when present,
+        otherwise uses exponential backoff with jitter.
+
+        Args:
+            retry_state: Tenacity retry state
+
+        Returns:
+            Wait time in seconds
+        """
+        exception = retry_state.outcome.exception()
+        response = getattr(exception, 'response', None)
+        if response is not None:
+            try:
+                return min(float(response.headers.get('retry-after')), self._retry_max_wait)
+            except (TypeError, ValueError):
+                pass
+        return self._backoff(retry_state)
+
+    @staticmethod
+    def _log_retry(retry_state):
+        """Report a failed attempt that is about to be retried."""
+        exception = retry_state.outcome.exception()
+        wait = retry_state.next_action.sleep if retry_state.next_action else 0
+        print(f"Warning: LLM API call failed ({str(exception)}), retrying in {wait:.1f}s "
+              f"(attempt {retry_state.attempt_number})")
+
+    def _cache_lookup(self, prompt: str):
+        """
+        Look up a prompt in the response cache.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Returns:
+            Tuple of (cache_key, cached_response); cache_key is None when the
+            request must not be cached
+        """
+        if self.cache is None or not self.cache.is_cacheable(self.temperature):
+            return None, None
+
+        key = self.cache.cache_key(self.model, prompt, self.temperature, self.max_tokens)
+        return key, self.cache.get(key)
+
+    def _cache_store(self, cache_key: str, result: str, cache_scope: Optional[str], embedding):
+        """
+        Store a response in the response cache, and in the semantic cache when embedded.
+
+        Args:
+            cache_key: Exact-cache key of the request
+            result: Response text
+            cache_scope: Semantic cache scope
+            embedding: Embedding of the request content, or None
+        """
+        self.cache.set(cache_key, result)
+        if embedding is not None:
+            self.semantic_cache.add(cache_scope, embedding, cache_key)
+
+    def _cache_scope(self, task_type: str, prompt_template: str, output_language: str) -> str:
+        """Semantic cache scope, so e.g. a summary never answers a translation request."""
+        # Editing the prompt or the token limit must not reuse answers to the old requests
+        settings = hashlib.sha256(f"{prompt_template}\0{self.max_tokens}".encode('utf-8')).hexdigest()[:16]
+        return f"{task_type}:{output_language}:{self.model}:{settings}"
+
+    def _embed(self, content: str):
+        """
+        Embed request content for the semantic cache.
+
+        Args:
+            content: Text content of the request
+
+        Returns:
+            Embedding vector or None if failed
+        """
+        try:
+            response = self.client.embeddings.create(
+                model=self.semantic_cache.embedding_model,
+                input=self.semantic_cache.embedding_input(content)
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Warning: Could not compute embedding for semantic cache: {str(e)}")
+            return None
+
+    async def _aembed(self, content: str):
+        """
+        Asynchronously embed request content for the semantic cache.
+
+        Args:
+            content: Text content of the request
+
+        Returns:
+            Embedding vector or None if failed
+        """
+        try:
+            response = await self.async_client.embeddings.create(
+                model=self.semantic_cache.embedding_model,
+                input=self.semantic_cache.embedding_input(content)
+            )
+            return response.data[0].embedding
+        except Exception as e:
+            print(f"Warning: Could not compute embedding for semantic cache: {str(e)}")
+            return None
+
+    def close(self):
+        """Close the underlying HTTP connection pool once no other client shares it."""
+        if self._http_released:
+            return
+        self._http_released = True
+
+        _HTTPX_USERS[self._http_key] -= 1
+        if _HTTPX_USERS[self._http_key] <= 0:
+            del _HTTPX_CLIENTS[self._http_key]
+            del _HTTPX_USERS[self._http_key]
+            self._http.close()
+
+    def _open_async(self):
+        """Create the asynchronous client state, which is bound to the event loop it is first used on."""
+        base_url, api_key, timeout, limits, max_concurrent_requests = self._async_settings
+        self._async_http = httpx.AsyncClient(verify=_SSL_CTX, limits=limits, timeout=timeout)
+        self.async_client = AsyncOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            timeout=timeout,
+            http_client=self._async_http,
+            max_retries=0
+        )
+
+        # Limits async requests across all files and translation chunks, so a
+        # few long papers cannot flood the API (and provoke 429 retry storms)
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+
+    async def aclose(self):
+        """
+        Close the underlying asynchronous HTTP connection pool.
+
+        The client can still be used afterwards, on a new event loop.
+        """
+        await self._async_http.aclose()
+        self._open_async()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _call_llm(self, prompt: str, cache_scope: Optional[str] = None, cache_content: Optional[str] = None) -> Optional[str]:
         """
         Make a call to the LLM API.
 
         Args:
             prompt: The prompt to send to the LLM
+            cache_scope: Semantic cache scope (task type, language and model)
+            cache_content: Request content used for semantic cache lookups
 
         Returns:
             Response text or None if failed
         """
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            return cached
+
+        # On an exact miss, look for a near-duplicate request of the same kind
+        embedding = None
+        if cache_key is not None and self.semantic_cache is not None and cache_scope is not None:
+            embedding = self._embed(cache_content)
+            if embedding is not None:
+                cached = self.semantic_cache.lookup(cache_scope, embedding)
+                if cached is not None:
+                    return cached
+
         try:
-            response = self.client.chat.completions.create(
+            response = Retrying(**self._retry_kwargs)(
+                self.client.chat.completions.create,
                 model=self.model,
                 messages=[
                     {
@@ -50,7 +388,10 @@ class LLMClient:
             )
 
             if response.choices and len(response.choices) > 0:
-                return response.choices[0].message.content
+                result = response.choices[0].message.content
+                if cache_key is not None and result:
+                    self._cache_store(cache_key, result, cache_scope, embedding)
+                return result
             else:
                 print("Error: No response from LLM")
                 return None
@@ -59,6 +400,248 @@ class LLMClient:
             print(f"Error calling LLM API: {str(e)}")
             return None
 
+    async def _acall_llm(self, prompt: str, cache_scope: Optional[str] = None, cache_content: Optional[str] = None) -> Optional[str]:
+        """
+        Make an asynchronous call to the LLM API.
+
+        Args:
+            prompt: The prompt to send to the LLM
+            cache_scope: Semantic cache scope (task type, language and model)
+            cache_content: Request content used for semantic cache lookups
+
+        Returns:
+            Response text or None if failed
+        """
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            return cached
+
+        # On an exact miss, look for a near-duplicate request of the same kind
+        embedding = None
+        if cache_key is not None and self.semantic_cache is not None and cache_scope is not None:
+            embedding = await self._aembed(cache_content)
+            if embedding is not None:
+                cached = self.semantic_cache.lookup(cache_scope, embedding)
+                if cached is not None:
+                    return cached
+
+        try:
+            # Bounded across all files and chunks, the retry waits included
+            async with self._request_slots:
+                # The openai create() is not detected as a coroutine function by
+                # tenacity, so the awaited call has to be inside the retry loop
+                async for attempt in AsyncRetrying(**self._retry_kwargs):
+                    with attempt:
+                        response = await self.async_client.chat.completions.create(
+                            model=self.model,
+                            messages=[
+                                {
+                                    "role": "user",
+                                    "content": prompt
+                                }
+                            ],
+                            max_tokens=self.max_tokens,
+                            temperature=self.temperature
+                        )
+
+            if response.choices and len(response.choices) > 0:
+                result = response.choices[0].message.content
+                if cache_key is not None and result:
+                    # Off the event loop: both caches write to disk
+                    await asyncio.to_thread(self._cache_store, cache_key, result, cache_scope, embedding)
+                return result
+            else:
+                print("Error: No response from LLM")
+                return None
+
+        except Exception as e:
+            print(f"Error calling LLM API: {str(e)}")
+            return None
+
+    def _stream_llm(self, prompt: str) -> Iterator[str]:
+        """
+        Make a streaming call to the LLM API.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Yields:
+            Response text deltas as they arrive
+
+        Raises:
+            Exception: If the API call fails
+        """
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            yield cached
+            return
+
+        # The full response is only kept when it has to be cached
+        parts = [] if cache_key is not None else None
+
+        stream = Retrying(**self._retry_kwargs)(
+            self.client.chat.completions.create,
+            model=self.model,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    if parts is not None:
+                        parts.append(delta)
+                    yield delta
+
+        if parts:
+            self.cache.set(cache_key, "".join(parts))
+
+    async def _astream_llm(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Make an asynchronous streaming call to the LLM API.
+
+        Args:
+            prompt: The prompt to send to the LLM
+
+        Yields:
+            Response text deltas as they arrive
+
+        Raises:
+            Exception: If the API call fails
+        """
+        cache_key, cached = self._cache_lookup(prompt)
+        if cached is not None:
+            yield cached
+            return
+
+        # The full response is only kept when it has to be cached
+        parts = [] if cache_key is not None else None
+
+        # The request stays in flight until the stream is consumed
+        async with self._request_slots:
+            async for attempt in AsyncRetrying(**self._retry_kwargs):
+                with attempt:
+                    stream = await self.async_client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {
+                                "role": "user",
+                                "content": prompt
+                            }
+                        ],
+                        max_tokens=self.max_tokens,
+                        temperature=self.temperature,
+                        stream=True
+                    )
+            async for chunk in stream:
+                if chunk.choices:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        if parts is not None:
+                            parts.append(delta)
+                        yield delta
+
+        if parts:
+            await asyncio.to_thread(self.cache.set, cache_key, "".join(parts))
+
+    def submit_batch(self, prompts: List[Tuple[str, str]]) -> Optional[str]:
+        """
+        Submit prompts as an asynchronous Batch API job.
+
+        Args:
+            prompts: List of (custom_id, prompt) tuples
+
+        Returns:
+            Batch ID or None if failed
+        """
+        lines = []
+        for custom_id, prompt in prompts:
+            lines.append(json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": prompt
+                        }
+                    ],
+                    "max_tokens": self.max_tokens,
+                    "temperature": self.temperature
+                }
+            }, ensure_ascii=False))
+
+        try:
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode('utf-8')),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            return batch.id
+
+        except Exception as e:
+            print(f"Error submitting batch: {str(e)}")
+            return None
+
+    def poll_batch(self, batch_id: str, poll_interval: float = 30.0) -> Optional[Dict[str, str]]:
+        """
+        Wait for a Batch API job to finish and download its results.
+
+        Args:
+            batch_id: Batch ID returned by submit_batch()
+            poll_interval: Seconds to wait between status checks
+
+        Returns:
+            Dictionary mapping custom_id to response text (failed requests are
+            left out), or None if the batch failed
+        """
+        try:
+            while True:
+                batch = self.client.batches.retrieve(batch_id)
+                if batch.status == "completed":
+                    break
+                if batch.status in ("failed", "expired", "cancelling", "cancelled"):
+                    print(f"Error: Batch {batch_id} ended with status '{batch.status}'")
+                    return None
+                time.sleep(poll_interval)
+
+            if not batch.output_file_id:
+                print(f"Error: Batch {batch_id} produced no output")
+                return None
+
+            output = self.client.files.content(batch.output_file_id).text
+
+        except Exception as e:
+            print(f"Error retrieving batch {batch_id}: {str(e)}")
+            return None
+
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            choices = (response.get("body") or {}).get("choices") or []
+            if choices:
+                results[record["custom_id"]] = choices[0]["message"]["content"]
+
+        return results
+
     def translate(self, content: str, prompt_template: str, output_language: str) -> Optional[str]:
         """
         Translate content using the LLM.
@@ -71,13 +654,13 @@ class LLMClient:
         Returns:
             Translated text or None if failed
         """
-        # Format the prompt with content and language
-        prompt = prompt_template.format(
-            content=content,
-            output_language=output_language
-        )
+        prompt = format_prompt(prompt_template, content, output_language)
 
-        return self._call_llm(prompt)
+        return self._call_llm(
+            prompt,
+            cache_scope=self._cache_scope('translate', prompt_template, output_language),
+            cache_content=content
+        )
 
     def summarize(self, content: str, prompt_template: str, output_language: str) -> Optional[str]:
         """
@@ -91,13 +674,13 @@ class LLMClient:
         Returns:
             Summary text or None if failed
         """
-        # Format the prompt with content and language
-        prompt = prompt_template.format(
-            content=content,
-            output_language=output_language
-        )
+        prompt = format_prompt(prompt_template, content, output_language)
 
-        return self._call_llm(prompt)
+        return self._call_llm(
+            prompt,
+            cache_scope=self._cache_scope('summarize', prompt_template, output_language),
+            cache_content=content
+        )
 
     def process(self, content: str, task_type: str, prompt_template: str, output_language: str) -> Optional[str]:
         """
@@ -119,3 +702,112 @@ class LLMClient:
         else:
             print(f"Error: Unknown task type '{task_type}'")
             return None
+
+    async def atranslate(self, content: str, prompt_template: str, output_language: str) -> Optional[str]:
+        """
+        Asynchronously translate content using the LLM.
+
+        Args:
+            content: Text content to translate
+            prompt_template: Prompt template with placeholders
+            output_language: Target language for translation
+
+        Returns:
+            Translated text or None if failed
+        """
+        prompt = format_prompt(prompt_template, content, output_language)
+
+        return await self._acall_llm(
+            prompt,
+            cache_scope=self._cache_scope('translate', prompt_template, output_language),
+            cache_content=content
+        )
+
+    async def atranslate_chunked(self, content: str, prompt_template: str, output_language: str, chunk_chars: int = 6000) -> Optional[str]:
+        """
+        Asynchronously translate long content by translating chunks in parallel.
+
+        The content is split on paragraph boundaries and every chunk is sent
+        as its own request; the translated chunks are joined in order.
+
+        Args:
+            content: Text content to translate
+            prompt_template: Prompt template with placeholders
+            output_language: Target language for translation
+            chunk_chars: Maximum chunk size in characters (0 disables chunking)
+
+        Returns:
+            Translated text or None if any chunk failed
+        """
+        if chunk_chars <= 0 or len(content) <= chunk_chars:
+            return await self.atranslate(content, prompt_template, output_language)
+
+        chunks = split_into_chunks(content, chunk_chars)
+        results = await asyncio.gather(*(
+            self.atranslate(chunk, prompt_template, output_language)
+            for chunk in chunks
+        ))
+
+        if not all(results):
+            return None
+
+        return "\n\n".join(results)
+
+    async def asummarize(self, content: str, prompt_template: str, output_language: str) -> Optional[str]:
+        """
+        Asynchronously summarize content using the LLM.
+
+        Args:
+            content: Text content to summarize
+            prompt_template: Prompt template with placeholders
+            output_language: Language for the summary
+
+        Returns:
+            Summary text or None if failed
+        """
+        prompt = format_prompt(prompt_template, content, output_language)
+
+        return await self._acall_llm(
+            prompt,
+            cache_scope=self._cache_scope('summarize', prompt_template, output_language),
+            cache_content=content
+        )
+
+    def stream(self, content: str, prompt_template: str, output_language: str) -> Iterator[str]:
+        """
+        Stream the LLM response for a translation or summarization prompt.
+
+        Args:
+            content: Text content to process
+            prompt_template: Prompt template with placeholders
+            output_language: Target language
+
+        Yields:
+            Response text deltas as they arrive
+
+        Raises:
+            Exception: If the API call fails
+        """
+        prompt = format_prompt(prompt_template, content, output_language)
+
+        yield from self._stream_llm(prompt)
+
+    async def astream(self, content: str, prompt_template: str, output_language: str) -> AsyncIterator[str]:
+        """
+        Asynchronously stream the LLM response for a translation or summarization prompt.
+
+        Args:
+            content: Text content to process
+            prompt_template: Prompt template with placeholders
+            output_language: Target language
+
+        Yields:
+            Response text deltas as they arrive
+
+        Raises:
+            Exception: If the API call fails
+        """
+        prompt = format_prompt(prompt_template, content, output_language)
+
+        async for delta in self._astream_llm(prompt):
+            yield delta
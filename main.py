@@ -6,17 +6,85 @@ Processes PDF files using LLM for translation and summarization.
 
 import os
 import sys
+import asyncio
+import logging
+from contextlib import ExitStack
 import yaml
 import time
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
 from tqdm import tqdm
 
-from pdf_processor import PDFProcessor
-from llm_client import LLMClient
+from app_config import AppConfig, ConfigError
+from pdf_processor import PDFProcessor, process_pool
+from llm_client import LLMClient, format_prompt
+from llm_cache import LLMCache, SemanticCache
 from output_writer import OutputWriter
 
 
+# Per-task labels and output locations used when reporting results
+TASK_LABELS = {
+    'translate': {
+        'start': "📝 Starting translation...",
+        'timing': "LLM Translation",
+        'prompt_key': 'translation',
+        'dir_key': 'translate_dir',
+        'stat': 'translated',
+        'done': "Translated",
+        'failed': "Failed to translate",
+        'write_failed': "Failed to write translation",
+    },
+    'summarize': {
+        'start': "📊 Starting summarization...",
+        'timing': "LLM Summarization",
+        'prompt_key': 'summarization',
+        'dir_key': 'summarize_dir',
+        'stat': 'summarized',
+        'done': "Summarized",
+        'failed': "Failed to summarize",
+        'write_failed': "Failed to write summary",
+    },
+}
+
+
+def _scan_files(root: str) -> frozenset:
+    """
+    Recursively list the files below a directory.
+
+    Args:
+        root: Directory to scan
+
+    Returns:
+        Frozenset of file paths relative to root (empty if root does not exist)
+    """
+    found = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        found.append(os.path.relpath(entry.path, root))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+    return frozenset(found)
+
+
+@dataclass
+class FileJob:
+    """An extracted file moving through the LLM and write stages."""
+    file_path: Path
+    relative_path: str
+    content: str
+    tasks: List[str]
+    pending: int
+    success: bool = True
+
+
 class PaperProcessor:
     """Main application class for processing academic papers."""
 
@@ -27,28 +95,45 @@ class PaperProcessor:
         Args:
             config_path: Path to configuration file
         """
-        self.config = self._load_config(config_path)
-        self._validate_config()
+        self.cfg = self._load_config(config_path)
 
         # Initialize components
         self.pdf_processor = PDFProcessor(
-            input_dir=self.config['paths']['input_dir'],
-            file_types=self.config['processing']['file_types']
+            input_dir=self.cfg.paths.input_dir,
+            file_types=self.cfg.processing.file_types,
+            fast_text_only=self.cfg.processing.fast_text_only,
+            extraction_cache=self.cfg.advanced.extraction_cache
         )
 
+        self.llm_cache = LLMCache(
+            cache_dir=self.cfg.advanced.cache_dir,
+            enabled=self.cfg.advanced.cache_enabled
+        )
+
+        self.semantic_cache = self._create_semantic_cache()
+
+        retry_config = self.cfg.advanced.retry
+
         self.llm_client = LLMClient(
-            base_url=self.config['api']['base_url'],
-            api_key=self.config['api']['api_key'],
-            model=self.config['api']['model'],
-            max_tokens=self.config['advanced']['max_tokens'],
-            temperature=self.config['advanced']['temperature'],
-            timeout=self.config['advanced'].get('timeout', 300)
+            base_url=self.cfg.api.base_url,
+            api_key=self.cfg.api.api_key,
+            model=self.cfg.api.model,
+            max_tokens=self.cfg.advanced.max_tokens,
+            temperature=self.cfg.advanced.temperature,
+            timeout=self.cfg.advanced.timeout,
+            max_keepalive_connections=self.cfg.advanced.max_keepalive_connections,
+            max_connections=self.cfg.advanced.max_connections,
+            cache=self.llm_cache,
+            semantic_cache=self.semantic_cache,
+            retry_max_attempts=retry_config.max_attempts,
+            retry_max_wait=retry_config.max_wait,
+            max_concurrent_requests=self.cfg.advanced.max_concurrent_requests
         )
 
         self.output_writer = OutputWriter(
-            output_format=self.config['processing']['output_format'],
-            formatting_config=self.config.get('formatting', {}),
-            output_language=self.config['processing']['output_language']
+            output_format=self.cfg.processing.output_format,
+            formatting_config=self.cfg.formatting,
+            output_language=self.cfg.processing.output_language
         )
 
         # Statistics
@@ -60,100 +145,116 @@ class PaperProcessor:
             'translated': 0,
             'summarized': 0
         }
+        self._stop_requested = False
+        self._existing_outputs = None
+        self._extract_executor = None
+
+    def _create_semantic_cache(self):
+        """
+        Create the semantic (embedding similarity) cache if enabled.
+
+        Returns:
+            SemanticCache instance, or None if disabled or unavailable
+        """
+        semantic_config = self.cfg.advanced.semantic_cache
+        if not (self.llm_cache.enabled and semantic_config.enabled):
+            return None
+
+        try:
+            return SemanticCache(
+                store=self.llm_cache,
+                embedding_model=semantic_config.embedding_model,
+                similarity_threshold=semantic_config.similarity_threshold
+            )
+        except ImportError as e:
+            print(f"Warning: Semantic cache disabled: {str(e)}")
+            return None
 
-    def _load_config(self, config_path: str) -> Dict[str, Any]:
+    def _load_config(self, config_path: str) -> AppConfig:
         """
-        Load configuration from YAML file.
+        Load and validate configuration from YAML file.
 
         Args:
             config_path: Path to config file
 
         Returns:
-            Configuration dictionary
+            Validated configuration
         """
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 config = yaml.safe_load(f)
-            return config
+            return AppConfig.from_dict(config)
         except FileNotFoundError:
             print(f"Error: Configuration file '{config_path}' not found.")
             sys.exit(1)
         except yaml.YAMLError as e:
             print(f"Error parsing configuration file: {str(e)}")
             sys.exit(1)
-
-    def _validate_config(self):
-        """Validate required configuration parameters."""
-        required_keys = [
-            ('api', 'base_url'),
-            ('api', 'api_key'),
-            ('api', 'model'),
-            ('processing', 'mode'),
-            ('paths', 'input_dir')
-        ]
-
-        for keys in required_keys:
-            current = self.config
-            for key in keys:
-                if key not in current:
-                    print(f"Error: Missing required configuration: {'.'.join(keys)}")
-                    sys.exit(1)
-                current = current[key]
-
-        # Validate processing mode
-        valid_modes = ['translate', 'summarize', 'both']
-        mode = self.config['processing']['mode']
-        if mode not in valid_modes:
-            print(f"Error: Invalid processing mode '{mode}'. Must be one of {valid_modes}")
+        except ConfigError as e:
+            print(f"Error: {str(e)}")
             sys.exit(1)
 
+    def _scan_outputs(self):
+        """
+        Index the existing output files once, so skip checks need no filesystem access.
+        """
+        mode = self.cfg.processing.mode
+        self._existing_outputs = {}
+        for task_type in ('translate', 'summarize'):
+            if mode in [task_type, 'both']:
+                root = getattr(self.cfg.paths, TASK_LABELS[task_type]['dir_key'])
+                self._existing_outputs[task_type] = _scan_files(root)
+
     def _check_output_exists(self, file_path: Path) -> Dict[str, bool]:
         """
         Check if output files already exist for a given input file.
 
+        Uses the index built by _scan_outputs() when available.
+
         Args:
             file_path: Path to the input file
 
         Returns:
             Dictionary with 'translate' and 'summarize' keys indicating if outputs exist
         """
-        mode = self.config['processing']['mode']
-        output_format = self.config['processing']['output_format']
+        mode = self.cfg.processing.mode
+        output_format = self.cfg.processing.output_format
         base_filename = file_path.stem
 
         # Get relative path
         relative_path = self.pdf_processor.get_relative_path(file_path)
-        relative_dir = Path(relative_path).parent
+        relative_output = str(Path(relative_path).parent / f"{base_filename}.{output_format}")
 
         exists = {'translate': False, 'summarize': False}
 
-        # Check translation output
-        if mode in ['translate', 'both']:
-            translate_path = Path(self.config['paths']['translate_dir']) / relative_dir / f"{base_filename}.{output_format}"
-            exists['translate'] = translate_path.exists()
-
-        # Check summarization output
-        if mode in ['summarize', 'both']:
-            summarize_path = Path(self.config['paths']['summarize_dir']) / relative_dir / f"{base_filename}.{output_format}"
-            exists['summarize'] = summarize_path.exists()
+        for task_type in ('translate', 'summarize'):
+            if mode not in [task_type, 'both']:
+                continue
+            if self._existing_outputs is not None:
+                exists[task_type] = relative_output in self._existing_outputs[task_type]
+            else:
+                output_root = Path(getattr(self.cfg.paths, TASK_LABELS[task_type]['dir_key']))
+                exists[task_type] = (output_root / relative_output).exists()
 
         return exists
 
-    def process_file(self, file_path: Path) -> bool:
+    async def _prepare_file(self, file_path: Path) -> Tuple[Optional[FileJob], bool]:
         """
-        Process a single file (translate and/or summarize).
+        Extraction stage: check existing outputs, then extract and truncate content.
 
         Args:
             file_path: Path to the file to process
 
         Returns:
-            True if successful, False otherwise
+            Tuple of (job, success); job is None if the file needs no LLM work
+            (skipped when success is True, failed otherwise)
         """
-        show_timing = self.config['advanced'].get('show_timing', True)
-        skip_existing = self.config['advanced'].get('skip_existing', True)
-        mode = self.config['processing']['mode']
+        show_timing = self.cfg.advanced.show_timing
+        skip_existing = self.cfg.advanced.skip_existing
+        mode = self.cfg.processing.mode
 
         # Check if outputs already exist
+        outputs_exist = {'translate': False, 'summarize': False}
         if skip_existing:
             outputs_exist = self._check_output_exists(file_path)
 
@@ -171,128 +272,534 @@ class PaperProcessor:
                 relative_path = self.pdf_processor.get_relative_path(file_path)
                 print(f"  ⊘ Skipped (already processed): {relative_path}")
                 self.stats['skipped'] += 1
-                return True  # Return True because it's not a failure
+                return None, True  # Not a failure
 
         if show_timing:
             print(f"\n{'='*70}")
             print(f"Processing: {file_path.name}")
             print(f"{'='*70}")
 
-        # Extract content
+        # Extract content (off the event loop so other files keep progressing)
         t_start = time.time()
-        content, success = self.pdf_processor.get_file_content(file_path)
+        content, success = await self.pdf_processor.get_file_content_async(file_path, self._extract_executor)
         t_extract = time.time() - t_start
 
         if not success or not content.strip():
             print(f"  ✗ Failed to extract content from {file_path.name}")
-            return False
+            return None, False
 
         # Truncate content if needed
-        max_chars = self.config['advanced'].get('max_content_chars', 0)
+        max_chars = self.cfg.advanced.max_content_chars
         original_length = len(content)
         if max_chars > 0 and len(content) > max_chars:
             content = content[:max_chars]
             if show_timing:
                 print(f"⚠️  Content truncated from {original_length:,} to {max_chars:,} chars")
 
-        if show_timing:
-            print(f"⏱️  PDF Extraction: {t_extract:.2f}s ({len(content):,} chars)")
-
-        # Get processing mode
-        output_language = self.config['processing']['output_language']
-
-        # Get base filename without extension
-        base_filename = file_path.stem
-
-        # Get relative path for preserving directory structure
+        # Concurrent files interleave their output, so timing lines name the file
         relative_path = self.pdf_processor.get_relative_path(file_path)
-        relative_dir = Path(relative_path).parent
-
-        file_success = True
+        if show_timing:
+            print(f"⏱️  [{relative_path}] PDF Extraction: {t_extract:.2f}s ({len(content):,} chars)")
 
-        # Check which outputs to skip (for mode='both')
-        skip_translate = False
-        skip_summarize = False
-        if skip_existing:
-            outputs_exist = self._check_output_exists(file_path)
-            skip_translate = outputs_exist['translate']
-            skip_summarize = outputs_exist['summarize']
+        tasks = []
 
         # Process translation
-        if mode in ['translate', 'both'] and not skip_translate:
-            if show_timing:
-                print(f"\n📝 Starting translation...")
-            t_start = time.time()
-            translated = self.llm_client.translate(
-                content=content,
-                prompt_template=self.config['prompts']['translation'],
-                output_language=output_language
-            )
-            t_translate = time.time() - t_start
-            if show_timing:
-                print(f"⏱️  LLM Translation: {t_translate:.2f}s")
-
-            if translated:
-                t_start = time.time()
-                output_dir = Path(self.config['paths']['translate_dir']) / relative_dir
-                success = self.output_writer.write(translated, output_dir, base_filename)
-                t_write = time.time() - t_start
-                if show_timing:
-                    print(f"⏱️  File Writing: {t_write:.2f}s")
-
-                if success:
-                    print(f"  ✓ Translated: {relative_path}")
-                    self.stats['translated'] += 1
-                else:
-                    print(f"  ✗ Failed to write translation: {relative_path}")
-                    file_success = False
-            else:
-                print(f"  ✗ Failed to translate: {relative_path}")
-                file_success = False
+        if mode in ['translate', 'both'] and not outputs_exist['translate']:
+            tasks.append('translate')
 
         # Show skip message for translation if skipped
-        elif mode in ['translate', 'both'] and skip_translate:
+        elif mode in ['translate', 'both']:
             if show_timing:
                 print(f"  ⊘ Translation already exists, skipping...")
 
         # Process summarization
-        if mode in ['summarize', 'both'] and not skip_summarize:
+        if mode in ['summarize', 'both'] and not outputs_exist['summarize']:
+            tasks.append('summarize')
+
+        # Show skip message for summarization if skipped
+        elif mode in ['summarize', 'both']:
             if show_timing:
-                print(f"\n📊 Starting summarization...")
-            t_start = time.time()
-            summarized = self.llm_client.summarize(
-                content=content,
-                prompt_template=self.config['prompts']['summarization'],
+                print(f"  ⊘ Summarization already exists, skipping...")
+
+        if not tasks:
+            return None, True
+
+        job = FileJob(
+            file_path=file_path,
+            relative_path=relative_path,
+            content=content,
+            tasks=tasks,
+            pending=len(tasks)
+        )
+        return job, True
+
+    def _use_streaming(self, task_type: str, content: str) -> bool:
+        """
+        Check whether a task's response is streamed directly into its output file.
+
+        Chunked translations are never streamed, since their chunks complete out of order.
+
+        Args:
+            task_type: Type of task ("translate" or "summarize")
+            content: Content to process
+
+        Returns:
+            True if the task should be streamed
+        """
+        if not self.cfg.advanced.stream_output:
+            return False
+
+        chunk_chars = self.cfg.advanced.chunk_chars
+        return not (task_type == 'translate' and chunk_chars > 0 and len(content) > chunk_chars)
+
+    def _output_dir(self, task_type: str, job: FileJob) -> Path:
+        """Output directory of a task, preserving the input directory structure."""
+        return Path(getattr(self.cfg.paths, TASK_LABELS[task_type]['dir_key'])) / Path(job.relative_path).parent
+
+    async def _generate(self, task_type: str, job: FileJob) -> Optional[str]:
+        """
+        LLM stage: translate or summarize the extracted content.
+
+        Args:
+            task_type: Type of task ("translate" or "summarize")
+            job: File being processed
+
+        Returns:
+            Generated text or None if failed
+        """
+        show_timing = self.cfg.advanced.show_timing
+        output_language = self.cfg.processing.output_language
+        labels = TASK_LABELS[task_type]
+
+        if show_timing:
+            print(f"\n{labels['start']}")
+
+        t_start = time.time()
+        if task_type == 'translate':
+            # Long translations are split into chunks that are translated in parallel
+            result = await self.llm_client.atranslate_chunked(
+                content=job.content,
+                prompt_template=self.cfg.prompts.translation,
+                output_language=output_language,
+                chunk_chars=self.cfg.advanced.chunk_chars
+            )
+        else:
+            result = await self.llm_client.asummarize(
+                content=job.content,
+                prompt_template=self.cfg.prompts.summarization,
                 output_language=output_language
             )
-            t_summarize = time.time() - t_start
-            if show_timing:
-                print(f"⏱️  LLM Summarization: {t_summarize:.2f}s")
-
-            if summarized:
-                t_start = time.time()
-                output_dir = Path(self.config['paths']['summarize_dir']) / relative_dir
-                success = self.output_writer.write(summarized, output_dir, base_filename)
-                t_write = time.time() - t_start
-                if show_timing:
-                    print(f"⏱️  File Writing: {t_write:.2f}s")
-
-                if success:
-                    print(f"  ✓ Summarized: {relative_path}")
-                    self.stats['summarized'] += 1
-                else:
-                    print(f"  ✗ Failed to write summary: {relative_path}")
-                    file_success = False
+        t_llm = time.time() - t_start
+        if show_timing:
+            print(f"⏱️  [{job.relative_path}] {labels['timing']}: {t_llm:.2f}s")
+
+        if not result:
+            print(f"  ✗ {labels['failed']}: {job.relative_path}")
+            return None
+
+        return result
+
+    async def _write_result(self, task_type: str, job: FileJob, result: str) -> bool:
+        """
+        Write stage: save a generated result to its output file.
+
+        Args:
+            task_type: Type of task ("translate" or "summarize")
+            job: File being processed
+            result: Generated text
+
+        Returns:
+            True if successful, False otherwise
+        """
+        show_timing = self.cfg.advanced.show_timing
+        labels = TASK_LABELS[task_type]
+
+        t_start = time.time()
+        success = await asyncio.to_thread(
+            self.output_writer.write, result, self._output_dir(task_type, job), job.file_path.stem
+        )
+        t_write = time.time() - t_start
+        if show_timing:
+            print(f"⏱️  [{job.relative_path}] File Writing: {t_write:.2f}s")
+
+        if success:
+            print(f"  ✓ {labels['done']}: {job.relative_path}")
+            self.stats[labels['stat']] += 1
+            return True
+
+        print(f"  ✗ {labels['write_failed']}: {job.relative_path}")
+        return False
+
+    async def _stream_task(self, task_type: str, job: FileJob) -> bool:
+        """
+        LLM and write stages combined: stream the response into its output file.
+
+        Args:
+            task_type: Type of task ("translate" or "summarize")
+            job: File being processed
+
+        Returns:
+            True if successful, False otherwise
+        """
+        show_timing = self.cfg.advanced.show_timing
+        labels = TASK_LABELS[task_type]
+
+        if show_timing:
+            print(f"\n{labels['start']}")
+
+        t_start = time.time()
+        success = await self._stream_to_file(
+            content=job.content,
+            prompt_template=getattr(self.cfg.prompts, labels['prompt_key']),
+            output_dir=self._output_dir(task_type, job),
+            base_filename=job.file_path.stem
+        )
+        t_llm = time.time() - t_start
+        if show_timing:
+            print(f"⏱️  [{job.relative_path}] {labels['timing']} + File Writing: {t_llm:.2f}s")
+
+        if success:
+            print(f"  ✓ {labels['done']}: {job.relative_path}")
+            self.stats[labels['stat']] += 1
+            return True
+
+        print(f"  ✗ {labels['failed']}: {job.relative_path}")
+        return False
+
+    async def _stream_to_file(self, content: str, prompt_template: str, output_dir: Path, base_filename: str) -> bool:
+        """
+        Stream an LLM response directly into an output file.
+
+        Args:
+            content: Extracted (and possibly truncated) file content
+            prompt_template: Prompt template with placeholders
+            output_dir: Directory where the output file is written
+            base_filename: Output filename (without extension)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            stream = self.output_writer.open_stream(output_dir, base_filename)
+        except Exception as e:
+            print(f"Error opening output for {base_filename}: {str(e)}")
+            return False
+
+        try:
+            async for delta in self.llm_client.astream(
+                content=content,
+                prompt_template=prompt_template,
+                output_language=self.cfg.processing.output_language
+            ):
+                stream.write(delta)
+        except Exception as e:
+            print(f"Error calling LLM API: {str(e)}")
+            stream.abort()
+            return False
+
+        if stream.length == 0:
+            print("Error: No response from LLM")
+            stream.abort()
+            return False
+
+        return await asyncio.to_thread(stream.close)
+
+    def _finish_file(self, file_path: Path, success: bool, progress):
+        """
+        Record the outcome of a file that has left the pipeline.
+
+        Args:
+            file_path: Path to the processed file
+            success: Whether all of the file's tasks succeeded (or it was skipped)
+            progress: tqdm progress bar, or None if disabled
+        """
+        if success:
+            self.stats['successful'] += 1
+        else:
+            self.stats['failed'] += 1
+
+            if not self.cfg.advanced.continue_on_error and not self._stop_requested:
+                print("\nStopping due to error (continue_on_error is disabled)")
+                self._stop_requested = True
+
+        if progress is not None:
+            progress.update(1)
+            # Name the latest file only every few files, without forcing a redraw
+            if progress.n % 10 == 0:
+                progress.set_postfix_str(file_path.name, refresh=False)
+
+    def _finish_task(self, job: FileJob, success: bool, progress):
+        """
+        Record the outcome of one task; the file is finished after its last task.
+
+        Args:
+            job: File being processed
+            success: Whether the task succeeded
+            progress: tqdm progress bar, or None if disabled
+        """
+        job.success = job.success and success
+        job.pending -= 1
+        if job.pending == 0:
+            self._finish_file(job.file_path, job.success, progress)
+
+    async def _extract_worker(self, extract_q: asyncio.Queue, llm_q: asyncio.Queue, progress):
+        """
+        Pipeline worker: extract file content and hand it to the LLM stage.
+
+        Args:
+            extract_q: Queue of files to extract (None ends the worker)
+            llm_q: Queue of extracted jobs
+            progress: tqdm progress bar, or None if disabled
+        """
+        while True:
+            file_path = await extract_q.get()
+            if file_path is None:
+                return
+            if self._stop_requested:
+                continue
+
+            try:
+                job, success = await self._prepare_file(file_path)
+            except Exception as e:
+                print(f"  ✗ Unexpected error processing {file_path.name}: {str(e)}")
+                job, success = None, False
+
+            if job is None:
+                self._finish_file(file_path, success, progress)
             else:
-                print(f"  ✗ Failed to summarize: {relative_path}")
-                file_success = False
+                await llm_q.put(job)
 
-        # Show skip message for summarization if skipped
-        elif mode in ['summarize', 'both'] and skip_summarize:
-            if show_timing:
-                print(f"  ⊘ Summarization already exists, skipping...")
+    async def _llm_task(self, task_type: str, job: FileJob, write_q: asyncio.Queue, progress):
+        """
+        Run one task of a job through the LLM and hand the result to the write stage.
+
+        Args:
+            task_type: Type of task ("translate" or "summarize")
+            job: File being processed
+            write_q: Queue of (job, task_type, result) items to write
+            progress: tqdm progress bar, or None if disabled
+        """
+        try:
+            if self._use_streaming(task_type, job.content):
+                self._finish_task(job, await self._stream_task(task_type, job), progress)
+                return
+
+            result = await self._generate(task_type, job)
+        except Exception as e:
+            print(f"  ✗ Unexpected error processing {job.file_path.name}: {str(e)}")
+            result = None
+
+        if result is None:
+            self._finish_task(job, False, progress)
+        else:
+            await write_q.put((job, task_type, result))
+
+    async def _llm_worker(self, llm_q: asyncio.Queue, write_q: asyncio.Queue, progress):
+        """
+        Pipeline worker: run the LLM tasks of extracted files.
+
+        Args:
+            llm_q: Queue of extracted jobs (None ends the worker)
+            write_q: Queue of (job, task_type, result) items to write
+            progress: tqdm progress bar, or None if disabled
+        """
+        while True:
+            job = await llm_q.get()
+            if job is None:
+                return
+            if self._stop_requested:
+                continue
 
-        return file_success
+            await asyncio.gather(*(self._llm_task(t, job, write_q, progress) for t in job.tasks))
+
+    async def _write_worker(self, write_q: asyncio.Queue, progress):
+        """
+        Pipeline worker: write generated results to output files.
+
+        Args:
+            write_q: Queue of (job, task_type, result) items (None ends the worker)
+            progress: tqdm progress bar, or None if disabled
+        """
+        while True:
+            item = await write_q.get()
+            if item is None:
+                return
+
+            job, task_type, result = item
+            try:
+                success = await self._write_result(task_type, job, result)
+            except Exception as e:
+                print(f"  ✗ Unexpected error processing {job.file_path.name}: {str(e)}")
+                success = False
+
+            self._finish_task(job, success, progress)
+
+    async def _process_all(self, files: List[Path]):
+        """
+        Process all files through an extract -> LLM -> write pipeline.
+
+        Extraction and writing run in worker threads (or, for PDF parsing,
+        worker processes) while other files wait on the LLM, so disk, CPU and
+        network work overlap. The number of files
+        in the LLM stage is bounded by advanced.max_concurrency.
+
+        Args:
+            files: Files to process
+        """
+        max_concurrency = self.cfg.advanced.max_concurrency
+        # Each extract worker keeps one PDF in the process pool, so there are at
+        # least as many workers as processes (otherwise the extra processes idle)
+        num_extract_workers = max(self.cfg.advanced.extract_workers, self.cfg.advanced.extract_processes)
+        num_write_workers = self.cfg.advanced.write_workers
+        self._stop_requested = False
+
+        extract_q = asyncio.Queue()
+        # Bounded so extraction does not run far ahead of the LLM and hold every file in memory
+        llm_q = asyncio.Queue(maxsize=max_concurrency)
+        write_q = asyncio.Queue()
+
+        for file_path in files:
+            extract_q.put_nowait(file_path)
+        for _ in range(num_extract_workers):
+            extract_q.put_nowait(None)
+
+        # Parse PDFs in worker processes instead of threads if configured
+        pool_stack = ExitStack()
+        if self.cfg.advanced.extract_processes > 0:
+            self._extract_executor = pool_stack.enter_context(process_pool(self.cfg.advanced.extract_processes))
+
+        # Create progress bar if enabled
+        progress = None
+        if self.cfg.advanced.show_progress:
+            progress = tqdm(total=len(files), desc="Processing", unit="file", mininterval=0.5, smoothing=0.1)
+
+        try:
+            extract_workers = [asyncio.create_task(self._extract_worker(extract_q, llm_q, progress))
+                               for _ in range(num_extract_workers)]
+            llm_workers = [asyncio.create_task(self._llm_worker(llm_q, write_q, progress))
+                           for _ in range(max_concurrency)]
+            write_workers = [asyncio.create_task(self._write_worker(write_q, progress))
+                             for _ in range(num_write_workers)]
+
+            # Shut the stages down in order once the previous stage has drained
+            await asyncio.gather(*extract_workers)
+            for _ in llm_workers:
+                await llm_q.put(None)
+            await asyncio.gather(*llm_workers)
+            for _ in write_workers:
+                await write_q.put(None)
+            await asyncio.gather(*write_workers)
+        finally:
+            if progress is not None:
+                progress.close()
+            pool_stack.close()
+            self._extract_executor = None
+            # The async pool is bound to this event loop, release it before the loop closes
+            await self.llm_client.aclose()
+
+    def process_file(self, file_path: Path) -> bool:
+        """
+        Process a single file (translate and/or summarize).
+
+        Args:
+            file_path: Path to the file to process
+
+        Returns:
+            True if successful (or skipped), False otherwise
+        """
+        failed_before = self.stats['failed']
+        asyncio.run(self._process_all([file_path]))
+        return self.stats['failed'] == failed_before
+
+    def _process_batch(self, files: List[Path]):
+        """
+        Process all files through the Batch API (one batch job per task type).
+
+        Args:
+            files: Files to process
+        """
+        skip_existing = self.cfg.advanced.skip_existing
+        max_chars = self.cfg.advanced.max_content_chars
+        output_language = self.cfg.processing.output_language
+        mode = self.cfg.processing.mode
+        task_types = [t for t in ('translate', 'summarize') if mode in [t, 'both']]
+
+        # Extract content and collect the pending tasks of every file
+        contents = {}
+        pending = {task_type: [] for task_type in task_types}
+        failed_files = set()
+
+        file_tasks = {}
+        for file_path in files:
+            outputs_exist = self._check_output_exists(file_path) if skip_existing else {}
+            tasks = [t for t in task_types if not outputs_exist.get(t, False)]
+
+            if tasks:
+                file_tasks[file_path] = tasks
+            else:
+                print(f"  ⊘ Skipped (already processed): {self.pdf_processor.get_relative_path(file_path)}")
+                self.stats['skipped'] += 1
+                self.stats['successful'] += 1  # Not a failure
+
+        # Extract all files up front, in parallel worker processes
+        print(f"Extracting {len(file_tasks)} file(s)...")
+        extracted = self.pdf_processor.extract_many(list(file_tasks))
+
+        for file_path, tasks in file_tasks.items():
+            relative_path = self.pdf_processor.get_relative_path(file_path)
+            content, success = extracted[file_path]
+            if not success or not content.strip():
+                print(f"  ✗ Failed to extract content from {file_path.name}")
+                failed_files.add(file_path)
+                continue
+
+            if max_chars > 0 and len(content) > max_chars:
+                content = content[:max_chars]
+
+            contents[relative_path] = (file_path, content)
+            for task_type in tasks:
+                pending[task_type].append(relative_path)
+
+        # Submit one batch per task type before waiting on any, so they run side by side
+        batch_ids = {}
+        for task_type in task_types:
+            if not pending[task_type]:
+                continue
+
+            labels = TASK_LABELS[task_type]
+            prompt_template = getattr(self.cfg.prompts, labels['prompt_key'])
+            prompts = [
+                (relative_path, format_prompt(prompt_template, contents[relative_path][1], output_language))
+                for relative_path in pending[task_type]
+            ]
+
+            print(f"\n{labels['start']} (batch of {len(prompts)})")
+            batch_ids[task_type] = self.llm_client.submit_batch(prompts)
+
+        # Wait for each batch and write its results
+        for task_type, batch_id in batch_ids.items():
+            labels = TASK_LABELS[task_type]
+            results = self.llm_client.poll_batch(batch_id) if batch_id else None
+            results = results or {}
+
+            for relative_path in pending[task_type]:
+                file_path = contents[relative_path][0]
+                result = results.get(relative_path)
+                if not result:
+                    print(f"  ✗ {labels['failed']}: {relative_path}")
+                    failed_files.add(file_path)
+                    continue
+
+                output_dir = Path(getattr(self.cfg.paths, labels['dir_key'])) / Path(relative_path).parent
+                if self.output_writer.write(result, output_dir, file_path.stem):
+                    print(f"  ✓ {labels['done']}: {relative_path}")
+                    self.stats[labels['stat']] += 1
+                else:
+                    print(f"  ✗ {labels['write_failed']}: {relative_path}")
+                    failed_files.add(file_path)
+
+        self.stats['failed'] += len(failed_files)
+        self.stats['successful'] += sum(1 for file_path, _ in contents.values() if file_path not in failed_files)
 
     def run(self):
         """Main execution method."""
@@ -302,59 +809,42 @@ class PaperProcessor:
         print()
 
         # Display configuration
-        print(f"Model: {self.config['api']['model']}")
-        print(f"Processing Mode: {self.config['processing']['mode']}")
-        print(f"Output Language: {self.config['processing']['output_language']}")
-        print(f"Output Format: {self.config['processing']['output_format']}")
-        print(f"Input Directory: {self.config['paths']['input_dir']}")
+        print(f"Model: {self.cfg.api.model}")
+        print(f"Processing Mode: {self.cfg.processing.mode}")
+        print(f"Output Language: {self.cfg.processing.output_language}")
+        print(f"Output Format: {self.cfg.processing.output_format}")
+        print(f"Input Directory: {self.cfg.paths.input_dir}")
         print()
 
         # Find files
         print("Scanning for files...")
-        files = self.pdf_processor.find_files()
+        files = self.pdf_processor.find_files_list()
         self.stats['total_files'] = len(files)
 
         if not files:
-            print(f"No files found in '{self.config['paths']['input_dir']}'")
-            print(f"Looking for file types: {', '.join(self.config['processing']['file_types'])}")
+            print(f"No files found in '{self.cfg.paths.input_dir}'")
+            print(f"Looking for file types: {', '.join(self.cfg.processing.file_types)}")
             return
 
         print(f"Found {len(files)} file(s) to process")
         print()
 
+        if self.cfg.advanced.skip_existing:
+            self._scan_outputs()
+
         # Process files
         print("Processing files...")
         print("-" * 70)
 
-        # Create progress bar if enabled
-        if self.config['advanced']['show_progress']:
-            iterator = tqdm(files, desc="Processing", unit="file")
-        else:
-            iterator = files
-
-        for file_path in iterator:
-            if self.config['advanced']['show_progress']:
-                iterator.set_description(f"Processing {file_path.name}")
-
-            try:
-                success = self.process_file(file_path)
-
-                if success:
-                    self.stats['successful'] += 1
+        try:
+            with self.llm_client:
+                if self.cfg.processing.batch_mode:
+                    self._process_batch(files)
                 else:
-                    self.stats['failed'] += 1
-
-                    if not self.config['advanced']['continue_on_error']:
-                        print("\nStopping due to error (continue_on_error is disabled)")
-                        break
-
-            except Exception as e:
-                print(f"  ✗ Unexpected error processing {file_path.name}: {str(e)}")
-                self.stats['failed'] += 1
-
-                if not self.config['advanced']['continue_on_error']:
-                    print("\nStopping due to error (continue_on_error is disabled)")
-                    break
+                    asyncio.run(self._process_all(files))
+        finally:
+            # Keep extracted text for the next run, even if this one was interrupted
+            self.pdf_processor.save_cache()
 
         # Print summary
         print()
@@ -367,13 +857,22 @@ class PaperProcessor:
         print(f"Failed: {self.stats['failed']}")
         print(f"Translations: {self.stats['translated']}")
         print(f"Summaries: {self.stats['summarized']}")
+        if self.llm_cache.enabled and not self.llm_cache.is_cacheable(self.cfg.advanced.temperature):
+            # Sampled responses are never cached, so there are no hits or misses to report
+            print(f"Cache: inactive (only used at temperature 0, "
+                  f"advanced.temperature is {self.cfg.advanced.temperature})")
+        elif self.llm_cache.enabled:
+            print(f"Cache hits: {self.llm_cache.hits}")
+            print(f"Cache misses: {self.llm_cache.misses}")
+            if self.semantic_cache is not None:
+                print(f"Semantic cache hits: {self.semantic_cache.hits}")
         print()
 
         if self.stats['translated'] > 0:
-            print(f"Translations saved to: {self.config['paths']['translate_dir']}/")
+            print(f"Translations saved to: {self.cfg.paths.translate_dir}/")
 
         if self.stats['summarized'] > 0:
-            print(f"Summaries saved to: {self.config['paths']['summarize_dir']}/")
+            print(f"Summaries saved to: {self.cfg.paths.summarize_dir}/")
 
         print("=" * 70)
 
@@ -385,6 +884,17 @@ def main():
     if len(sys.argv) > 1:
         config_path = sys.argv[1]
 
+    # Warnings and errors from the extraction stage are reported through logging
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s: %(message)s")
+
+    # Use the faster uvloop event loop when it is installed
+    if sys.platform != 'win32':
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     # Create and run processor
     processor = PaperProcessor(config_path)
     processor.run()
@@ -1,6 +1,8 @@
+import io
 import os
+import re
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from docx import Document
 from docx.shared import Pt, Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_PARAGRAPH_ALIGNMENT
@@ -8,6 +10,47 @@ from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
 
+# Basic LaTeX document structure wrapped around the escaped content
+TEX_HEADER = """\\documentclass{article}
+\\usepackage[utf8]{inputenc}
+\\usepackage{geometry}
+\\geometry{a4paper, margin=1in}
+
+\\begin{document}
+
+"""
+TEX_FOOTER = "\n\n\\end{document}"
+
+# Special LaTeX characters and their escaped form, replaced in a single pass
+_TEX_ESCAPES = {
+    '\\': r'\textbackslash{}',
+    '&': r'\&',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '^': r'\textasciicircum{}',
+}
+_TEX_SPECIAL_RE = re.compile(r'[\\&%$#_{}~^]')
+
+# A paragraph split into its leading markdown heading markers and its text
+_PARAGRAPH_RE = re.compile(r'\s*(#*)\s*(.*?)\s*\Z', re.DOTALL)
+
+# DOCX paragraph style by heading level (0 = body text); level 1 is the title
+_PARAGRAPH_STYLES = ('Normal', 'Heading 2', 'Heading 3', 'Heading 4')
+
+# Elements that must follow w:bidi inside w:pPr (OOXML schema order)
+_BIDI_SUCCESSORS = (
+    'w:adjustRightInd', 'w:snapToGrid', 'w:spacing', 'w:ind', 'w:contextualSpacing',
+    'w:mirrorIndents', 'w:suppressOverlap', 'w:jc', 'w:textDirection', 'w:textAlignment',
+    'w:textboxTightWrap', 'w:outlineLvl', 'w:divId', 'w:cnfStyle', 'w:rPr', 'w:sectPr',
+    'w:pPrChange'
+)
+
+
 class OutputWriter:
     """Handles writing processed content to various output formats."""
 
@@ -33,6 +76,9 @@ class OutputWriter:
         self.font_size = font_config.get('size', 13)
         self.heading_size = font_config.get('heading_size', 16)
 
+        # Styled DOCX template, serialized once and reopened for every document
+        self._template_bytes = self._build_docx_template() if self.output_format == "docx" else None
+
     def _detect_rtl(self) -> bool:
         """
         Detect if text direction should be RTL based on configuration or language.
@@ -86,44 +132,158 @@ class OutputWriter:
             print(f"Error writing file {output_file}: {str(e)}")
             return False
 
-    def _set_rtl(self, paragraph):
+    def open_stream(self, output_path: Path, original_filename: str) -> "OutputStream":
+        """
+        Open an output file that content is written to incrementally.
+
+        Args:
+            output_path: Directory path where file should be written
+            original_filename: Original filename (without extension)
+
+        Returns:
+            OutputStream accepting content chunks
+
+        Raises:
+            ValueError: If the output format is not supported
+            OSError: If the output file cannot be created
+        """
+        if self.output_format not in ("docx", "tex", "txt", "md"):
+            raise ValueError(f"Unsupported output format '{self.output_format}'")
+
+        output_path.mkdir(parents=True, exist_ok=True)
+        output_file = output_path / f"{original_filename}.{self.output_format}"
+        return OutputStream(self, output_file, original_filename)
+
+    def write_stream(self, chunks: Iterable[str], output_path: Path, original_filename: str) -> bool:
         """
-        Set RTL (right-to-left) text direction for a paragraph.
+        Write streamed content chunks to file in specified format as they arrive.
 
         Args:
-            paragraph: The paragraph object to modify
+            chunks: Iterable of content chunks (e.g. LLM response deltas)
+            output_path: Directory path where file should be written
+            original_filename: Original filename (without extension)
+
+        Returns:
+            True if successful, False otherwise
         """
-        pPr = paragraph._element.get_or_add_pPr()
+        try:
+            stream = self.open_stream(output_path, original_filename)
+        except Exception as e:
+            print(f"Error opening output for {original_filename}: {str(e)}")
+            return False
+
+        try:
+            for chunk in chunks:
+                stream.write(chunk)
+        except Exception as e:
+            print(f"Error writing file {stream.output_file}: {str(e)}")
+            stream.abort()
+            return False
+
+        return stream.close()
+
+    def _apply_style_font(self, style, font_size):
+        """
+        Set the configured font on a paragraph style.
+
+        Args:
+            style: The style to modify
+            font_size: Font size in points
+        """
+        style.font.name = self.font_name
+        style.font.size = Pt(font_size)
+
+        # Explicit fonts (including complex script for RTL languages); theme
+        # fonts of the built-in heading styles would otherwise take precedence
+        rFonts = style.element.get_or_add_rPr().get_or_add_rFonts()
+        for theme_attr in ('w:asciiTheme', 'w:hAnsiTheme', 'w:eastAsiaTheme', 'w:cstheme'):
+            rFonts.attrib.pop(qn(theme_attr), None)
+        rFonts.set(qn('w:cs'), self.font_name)
+        rFonts.set(qn('w:ascii'), self.font_name)
+        rFonts.set(qn('w:hAnsi'), self.font_name)
+
+    def _set_style_rtl(self, style):
+        """
+        Set RTL (right-to-left) text direction on a paragraph style.
+
+        Args:
+            style: The style to modify
+        """
+        pPr = style.element.get_or_add_pPr()
         bidi = OxmlElement('w:bidi')
         bidi.set(qn('w:val'), '1')
-        pPr.append(bidi)
+        pPr.insert_element_before(bidi, *_BIDI_SUCCESSORS)
 
-    def _apply_font_and_rtl(self, paragraph, font_size=None):
+    def _build_docx_template(self) -> bytes:
         """
-        Apply font and RTL settings to a paragraph.
+        Build the DOCX template with font, alignment and direction set on its styles.
 
-        Args:
-            paragraph: The paragraph to modify
-            font_size: Font size in points (if None, uses self.font_size)
+        Paragraphs added to documents created from it only need a style, so no
+        per-run formatting is required.
+
+        Returns:
+            Serialized template document
         """
-        if font_size is None:
-            font_size = self.font_size
+        doc = Document()
+        styles = doc.styles
+
+        normal = styles['Normal']
+        self._apply_style_font(normal, self.font_size)
+        normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT if self.is_rtl else WD_ALIGN_PARAGRAPH.JUSTIFY
+
+        for level in range(1, 5):
+            heading = styles[f'Heading {level}']
+            self._apply_style_font(heading, self.heading_size)
+            if self.is_rtl:
+                heading.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+            elif level == 1:
+                # Level 1 is only used for the document title
+                heading.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            else:
+                heading.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.LEFT
 
-        # Set alignment first
         if self.is_rtl:
-            self._set_rtl(paragraph)
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-        else:
-            paragraph.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+            for name in ('Normal', 'Heading 1', 'Heading 2', 'Heading 3', 'Heading 4'):
+                self._set_style_rtl(styles[name])
+
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return buffer.getvalue()
 
-        # Apply font to all runs in the paragraph
-        for run in paragraph.runs:
-            run.font.name = self.font_name
-            run.font.size = Pt(font_size)
-            # Set complex script font for RTL languages
-            run._element.rPr.rFonts.set(qn('w:cs'), self.font_name)
-            run._element.rPr.rFonts.set(qn('w:ascii'), self.font_name)
-            run._element.rPr.rFonts.set(qn('w:hAnsi'), self.font_name)
+    def _new_docx(self, title: str):
+        """
+        Create a new DOCX document with a title heading.
+
+        Args:
+            title: Document title
+
+        Returns:
+            Tuple of (Document, paragraph styles indexed by heading level)
+        """
+        doc = Document(io.BytesIO(self._template_bytes))
+        doc.add_heading(title, level=1)
+
+        # Resolve the styles once per document rather than by name per paragraph
+        styles = tuple(doc.styles[name] for name in _PARAGRAPH_STYLES)
+        return doc, styles
+
+    @staticmethod
+    def _add_docx_paragraphs(doc, styles, content: str):
+        """
+        Add paragraphs (and markdown-style headings) of content to a DOCX document.
+
+        Formatting comes from the template styles.
+
+        Args:
+            doc: Document to add to
+            styles: Paragraph styles indexed by heading level (from _new_docx)
+            content: Text content, paragraphs separated by blank lines
+        """
+        add_paragraph = doc.add_paragraph
+        for para_text in content.split('\n\n'):
+            hashes, text = _PARAGRAPH_RE.match(para_text).groups()
+            if hashes or text:
+                add_paragraph(text, styles[min(len(hashes), 3)])
 
     def _write_docx(self, content: str, output_file: Path, title: str) -> bool:
         """
@@ -138,68 +298,8 @@ class OutputWriter:
             True if successful, False otherwise
         """
         try:
-            doc = Document()
-
-            # Add title - create empty heading first
-            title_paragraph = doc.add_heading(level=1)
-            title_run = title_paragraph.add_run(title)
-
-            # Set title formatting
-            title_run.font.name = self.font_name
-            title_run.font.size = Pt(self.heading_size)
-            title_run._element.rPr.rFonts.set(qn('w:cs'), self.font_name)
-            title_run._element.rPr.rFonts.set(qn('w:ascii'), self.font_name)
-            title_run._element.rPr.rFonts.set(qn('w:hAnsi'), self.font_name)
-
-            if self.is_rtl:
-                self._set_rtl(title_paragraph)
-                title_paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            else:
-                title_paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-            # Add content - split into paragraphs
-            paragraphs = content.split('\n\n')
-
-            for para_text in paragraphs:
-                if para_text.strip():
-                    # Check if it's a heading (starts with #)
-                    if para_text.strip().startswith('#'):
-                        # Remove markdown heading markers
-                        heading_text = para_text.strip().lstrip('#').strip()
-                        level = min(para_text.count('#'), 3)
-
-                        # Create heading with text
-                        heading = doc.add_heading(level=level + 1)
-                        heading_run = heading.add_run(heading_text)
-
-                        # Apply font
-                        heading_run.font.name = self.font_name
-                        heading_run.font.size = Pt(self.heading_size)
-                        heading_run._element.rPr.rFonts.set(qn('w:cs'), self.font_name)
-                        heading_run._element.rPr.rFonts.set(qn('w:ascii'), self.font_name)
-                        heading_run._element.rPr.rFonts.set(qn('w:hAnsi'), self.font_name)
-
-                        if self.is_rtl:
-                            self._set_rtl(heading)
-                            heading.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                    else:
-                        # Create paragraph with text
-                        para = doc.add_paragraph()
-                        para_run = para.add_run(para_text.strip())
-
-                        # Apply font
-                        para_run.font.name = self.font_name
-                        para_run.font.size = Pt(self.font_size)
-                        para_run._element.rPr.rFonts.set(qn('w:cs'), self.font_name)
-                        para_run._element.rPr.rFonts.set(qn('w:ascii'), self.font_name)
-                        para_run._element.rPr.rFonts.set(qn('w:hAnsi'), self.font_name)
-
-                        # Set paragraph alignment and RTL
-                        if self.is_rtl:
-                            self._set_rtl(para)
-                            para.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-                        else:
-                            para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+            doc, styles = self._new_docx(title)
+            self._add_docx_paragraphs(doc, styles, content)
 
             # Save document
             doc.save(output_file)
@@ -209,6 +309,19 @@ class OutputWriter:
             print(f"Error creating DOCX file: {str(e)}")
             return False
 
+    @staticmethod
+    def _escape_tex(content: str) -> str:
+        """
+        Escape special LaTeX characters.
+
+        Args:
+            content: Text content
+
+        Returns:
+            Escaped text
+        """
+        return _TEX_SPECIAL_RE.sub(lambda m: _TEX_ESCAPES[m.group(0)], content)
+
     def _write_tex(self, content: str, output_file: Path) -> bool:
         """
         Write content to LaTeX file.
@@ -221,29 +334,7 @@ class OutputWriter:
             True if successful, False otherwise
         """
         try:
-            # Create a basic LaTeX document structure
-            latex_content = """\\documentclass{article}
-\\usepackage[utf8]{inputenc}
-\\usepackage{geometry}
-\\geometry{a4paper, margin=1in}
-
-\\begin{document}
-
-"""
-            # Escape special LaTeX characters
-            escaped_content = content.replace('\\', '\\textbackslash{}')
-            escaped_content = escaped_content.replace('&', '\\&')
-            escaped_content = escaped_content.replace('%', '\\%')
-            escaped_content = escaped_content.replace('$', '\\$')
-            escaped_content = escaped_content.replace('#', '\\#')
-            escaped_content = escaped_content.replace('_', '\\_')
-            escaped_content = escaped_content.replace('{', '\\{')
-            escaped_content = escaped_content.replace('}', '\\}')
-            escaped_content = escaped_content.replace('~', '\\textasciitilde{}')
-            escaped_content = escaped_content.replace('^', '\\textasciicircum{}')
-
-            latex_content += escaped_content
-            latex_content += "\n\n\\end{document}"
+            latex_content = TEX_HEADER + self._escape_tex(content) + TEX_FOOTER
 
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write(latex_content)
@@ -293,3 +384,86 @@ class OutputWriter:
         except Exception as e:
             print(f"Error creating MD file: {str(e)}")
             return False
+
+
+class OutputStream:
+    """Incrementally written output file, created by OutputWriter.open_stream()."""
+
+    def __init__(self, writer: OutputWriter, output_file: Path, title: str):
+        """
+        Initialize output stream.
+
+        Args:
+            writer: OutputWriter providing format and formatting settings
+            output_file: Path to output file
+            title: Document title (used for DOCX)
+        """
+        self.writer = writer
+        self.output_file = output_file
+        self.length = 0
+
+        self._doc = None
+        self._styles = None
+        self._file = None
+        self._buffer = ""
+
+        if writer.output_format == "docx":
+            # DOCX is assembled in memory paragraph by paragraph and saved on close
+            self._doc, self._styles = writer._new_docx(title)
+        else:
+            self._file = open(output_file, 'w', encoding='utf-8')
+            if writer.output_format == "tex":
+                self._file.write(TEX_HEADER)
+
+    def write(self, chunk: str):
+        """
+        Write a content chunk.
+
+        Args:
+            chunk: Content chunk
+        """
+        self.length += len(chunk)
+
+        if self._doc is not None:
+            # Add every completed paragraph as soon as its boundary arrives
+            self._buffer += chunk
+            if '\n\n' in self._buffer:
+                completed, self._buffer = self._buffer.rsplit('\n\n', 1)
+                self.writer._add_docx_paragraphs(self._doc, self._styles, completed)
+        elif self.writer.output_format == "tex":
+            # Escaping is per character, so chunks can be escaped independently
+            self._file.write(self.writer._escape_tex(chunk))
+        else:
+            self._file.write(chunk)
+
+    def close(self) -> bool:
+        """
+        Finish writing the output file.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if self._doc is not None:
+                self.writer._add_docx_paragraphs(self._doc, self._styles, self._buffer)
+                self._buffer = ""
+                self._doc.save(self.output_file)
+            else:
+                if self.writer.output_format == "tex":
+                    self._file.write(TEX_FOOTER)
+                self._file.close()
+            return True
+
+        except Exception as e:
+            print(f"Error creating {self.writer.output_format.upper()} file: {str(e)}")
+            self.abort()
+            return False
+
+    def abort(self):
+        """Discard the partially written output file."""
+        if self._file is not None:
+            self._file.close()
+        try:
+            self.output_file.unlink()
+        except FileNotFoundError:
+            pass
@@ -1,46 +1,521 @@
 import os
+import sys
+import mmap
+import asyncio
+import logging
+import multiprocessing
+import codecs
+import json
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from io import StringIO
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import pdfplumber
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import PDFStream, resolve1
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency, only used to compress the extraction cache
+    zstandard = None
+
+
+logger = logging.getLogger(__name__)
+
+# Default number of extraction processes (pdfminer parsing is CPU-bound and holds the GIL)
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 6)
+
+# Text files larger than this are read through a memory map
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Largest PDF that is memory-mapped (32-bit builds cannot map files over 2 GB)
+MMAP_MAX_SIZE = sys.maxsize if sys.maxsize > 2**32 else 2**31 - 1
+
+# Extraction cache file (in the input directory) and the zstd frame magic number
+CACHE_FILENAME = ".pdf_cache.json"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+# Placeholder for pages without extractable text
+_NO_TEXT = "[No extractable text]"
+
+# Byte forms of the page layout, for writing extracted text straight to disk
+_PAGE_HEADER_BYTES = b"--- Page %d ---\n"
+_NO_TEXT_BYTES = _NO_TEXT.encode()
+_PAGE_SEPARATOR_BYTES = b"\n\n"
+
+
+def _join_pages(page_texts: List[Optional[str]]) -> str:
+    """
+    Join page texts into the document text, each page under its header.
+
+    Args:
+        page_texts: Raw text of each page, in order
+
+    Returns:
+        Document text
+    """
+    # Sized up front and filled by index: no list growth and no enumerate() tuples
+    n = len(page_texts)
+    text_content = [None] * n
+    for i in range(n):
+        # Formatted inline: a helper call per page costs more than the formatting itself
+        page_text = page_texts[i] or _NO_TEXT
+        text_content[i] = f"--- Page {i + 1} ---\n{page_text}"
+    return "\n\n".join(text_content)
+
+
+@contextmanager
+def _open_pdf(pdf_path: Path) -> Iterator[pdfplumber.PDF]:
+    """
+    Open a PDF with pdfplumber, reading it through a memory map where possible.
+
+    pdfminer seeks back and forth through the file (xref table, objects,
+    content streams); with a memory map those reads are served from the page
+    cache without a syscall each. Empty or very large files fall back to
+    buffered reads.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Yields:
+        Open pdfplumber PDF
+    """
+    with open(pdf_path, 'rb') as f:
+        mapped = None
+        try:
+            if 0 < os.fstat(f.fileno()).st_size <= MMAP_MAX_SIZE:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mapped = None
+
+        try:
+            with pdfplumber.open(mapped if mapped is not None else f) as pdf:
+                yield pdf
+        finally:
+            if mapped is not None:
+                mapped.close()
+
+
+def _has_font_resources(resources: Any, depth: int = 0) -> bool:
+    """
+    Check whether a page (or form) resource dictionary references any font.
+
+    Text can only be drawn with a font resource, so a page without one -
+    directly or in one of its form XObjects - is image-only (e.g. scanned).
+
+    Args:
+        resources: pdfminer resource dictionary (may be an unresolved reference)
+        depth: Form XObject nesting depth (guards against reference cycles)
+
+    Returns:
+        True if the resources reference a font
+    """
+    resources = resolve1(resources)
+    if not isinstance(resources, dict):
+        return False
+    if resolve1(resources.get('Font')):
+        return True
+
+    xobjects = resolve1(resources.get('XObject'))
+    if depth < 8 and isinstance(xobjects, dict):
+        for xobject in xobjects.values():
+            xobject = resolve1(xobject)
+            if (isinstance(xobject, PDFStream)
+                    and getattr(resolve1(xobject.get('Subtype')), 'name', None) == 'Form'
+                    and _has_font_resources(xobject.get('Resources'), depth + 1)):
+                return True
+    return False
+
+
+def _iter_pdfminer_page_texts(pdf_path: Path, start: int = 0, stop: Optional[int] = None,
+                              skip_scanned: bool = False, chunk: int = 0) -> Iterator[str]:
+    """
+    Extract page texts with pdfminer directly, skipping pdfplumber's object layer.
+
+    The document is walked once, and each page is laid out the way pdfminer's
+    extract_text() does it, so the text is the same.
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page
+        stop: Index after the last page (None for the end of the document)
+        skip_scanned: Do not run text extraction on image-only pages
+        chunk: Drop pdfminer's font and resource cache every this many pages (0 never)
+
+    Yields:
+        Page texts (empty for pages without text)
+    """
+    if stop is not None and stop <= start:
+        return
+
+    laparams = LAParams()
+    output = StringIO()
+    interpreter = None
+    with open(pdf_path, 'rb') as fp:
+        for index, page in enumerate(PDFPage.get_pages(fp, maxpages=stop or 0)):
+            if index < start:
+                continue
+            if skip_scanned and not _has_font_resources(page.resources):
+                yield ''
+                continue
+
+            if interpreter is None or (chunk and (index - start) % chunk == 0):
+                resources = PDFResourceManager(caching=True)
+                interpreter = PDFPageInterpreter(resources, TextConverter(resources, output, laparams=laparams))
+
+            # The converter ends every page with a form feed, which strip() removes
+            interpreter.process_page(page)
+            yield output.getvalue().strip()
+            output.seek(0)
+            output.truncate()
+
+
+def _init_worker_logging(queue, level: int):
+    """Process pool initializer: forward the worker's log records to the parent process."""
+    root = logging.getLogger()
+    root.handlers[:] = [QueueHandler(queue)]
+    root.setLevel(level)
+
+
+@contextmanager
+def process_pool(max_workers: int) -> Iterator[ProcessPoolExecutor]:
+    """
+    Create a process pool whose workers log through the parent's handlers.
+
+    Worker records are sent over a queue and emitted by a listener thread in
+    the parent, so workers never write to the console themselves.
+
+    Args:
+        max_workers: Number of worker processes
+
+    Yields:
+        ProcessPoolExecutor (shut down when the context exits)
+    """
+    # The pool is often started from a running event loop with live threads,
+    # which fork() would copy into the workers half-initialized
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    )
+
+    root = logging.getLogger()
+    queue = context.Queue()
+    listener = QueueListener(queue, *(root.handlers or [logging.lastResort]), respect_handler_level=True)
+    listener.start()
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context, initializer=_init_worker_logging,
+                                 initargs=(queue, root.getEffectiveLevel())) as executor:
+            yield executor
+    finally:
+        listener.stop()
+
+
+def _extract_pdf_worker(pdf_path: Path, options: Dict[str, Any]) -> Tuple[str, bool]:
+    """Process pool worker: extract the text of a whole PDF."""
+    return PDFProcessor(os.curdir, ['pdf'], **options).extract_text_from_pdf(pdf_path)
+
+
+def _extract_page_range_worker(pdf_path: Path, start: int, stop: int,
+                               options: Dict[str, Any]) -> List[Optional[str]]:
+    """
+    Process pool worker: extract the text of a range of pages.
+
+    Page objects cannot be pickled, so each worker opens the PDF itself.
+
+    Args:
+        pdf_path: Path to the PDF file
+        start: Index of the first page
+        stop: Index after the last page
+        options: PDFProcessor constructor options
+
+    Returns:
+        List of page texts (None or empty for pages without text)
+    """
+    return list(PDFProcessor(os.curdir, ['pdf'], **options)._iter_page_texts(pdf_path, start, stop))
 
 
 class PDFProcessor:
     """Handles PDF file discovery and content extraction."""
 
-    def __init__(self, input_dir: str, file_types: List[str]):
+    # Fixed attribute layout: no per-instance __dict__, faster attribute access
+    __slots__ = (
+        "input_dir", "file_types", "fast_text_only", "skip_scanned",
+        "_input_prefix", "_ext_set", "_pdf_ext", "_text_exts", "_handlers",
+        "_cache_path", "_cache", "_cache_used", "_cache_dirty", "_stat_cache",
+    )
+
+    def __init__(self, input_dir: str, file_types: List[str], fast_text_only: bool = False,
+                 skip_scanned: bool = True, extraction_cache: bool = False):
         """
         Initialize PDF processor.
 
         Args:
             input_dir: Root directory to search for files
             file_types: List of file extensions to process (e.g., ['pdf', 'txt'])
+            fast_text_only: Extract PDF text with pdfminer directly instead of
+                pdfplumber (faster, but line layout may differ slightly)
+            skip_scanned: Do not run text extraction on image-only (scanned) pages,
+                which cannot contain extractable text
+            extraction_cache: Reuse the text of unchanged PDFs, keyed by path,
+                modification time and size. The cache is kept in memory and
+                saved to input_dir/.pdf_cache.json by save_cache()
         """
         self.input_dir = Path(input_dir)
+        # Found files are built from str(input_dir), so their paths start with this prefix
+        self._input_prefix = str(self.input_dir) + os.sep
         self.file_types = [ft.lower().strip('.') for ft in file_types]
+        self.fast_text_only = fast_text_only
+        self.skip_scanned = skip_scanned
 
-    def find_files(self) -> List[Path]:
+        # Lowercased extensions, computed once (matched without the dot while walking)
+        self._ext_set = frozenset(self.file_types)
+        self._pdf_ext = ".pdf"
+        self._text_exts = frozenset({".txt", ".md", ".tex"})
+
+        # Content readers by file extension
+        self._handlers = {self._pdf_ext: self.extract_text_from_pdf}
+        self._handlers.update(dict.fromkeys(self._text_exts, self.read_text_file))
+
+        # Extraction cache: (path, mtime_ns, size, fast_text_only) -> (text, success)
+        self._cache_path = self.input_dir / CACHE_FILENAME
+        self._cache = self._load_cache() if extraction_cache else None
+        self._cache_used = set()
+        self._cache_dirty = False
+        # stat results from the directory walk, so cache lookups need no extra syscall
+        self._stat_cache = {}
+
+    def _scandir_recursive(self, path: str) -> Iterator[os.DirEntry]:
+        """
+        Recursively yield the directory entries below a directory.
+
+        DirEntry objects cache their type information, so the walk needs no
+        extra stat() call per file. Unreadable directories are skipped.
+
+        Args:
+            path: Directory to walk
+
+        Yields:
+            DirEntry objects for files (directories are descended into)
+        """
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from self._scandir_recursive(entry.path)
+                    else:
+                        yield entry
+        except PermissionError as e:
+            logger.warning("Skipping unreadable directory '%s': %s", path, e)
+
+    def iter_files(self, sort: bool = False) -> Iterator[Path]:
+        """
+        Recursively find files with specified extensions, yielding them as they are discovered.
+
+        Args:
+            sort: Yield the files in sorted order (requires walking the whole tree first)
+
+        Yields:
+            Path objects for found files
+        """
+        if sort:
+            yield from self.find_files_list()
+            return
+
+        if not self.input_dir.exists():
+            logger.warning("Input directory '%s' does not exist.", self.input_dir)
+            return
+
+        # Single walk over the tree, matching all extensions at once
+        exts = self._ext_set
+        for entry in self._scandir_recursive(str(self.input_dir)):
+            # rpartition is a single C call, unlike os.path.splitext
+            stem, _, extension = entry.name.rpartition('.')
+            if stem and extension.lower() in exts and entry.is_file():
+                if self._cache is not None:
+                    try:
+                        self._stat_cache[entry.path] = entry.stat()
+                    except OSError:
+                        pass
+                yield Path(entry.path)
+
+    def find_files_list(self) -> List[Path]:
         """
         Recursively find all files with specified extensions in input directory.
 
         Returns:
-            List of Path objects for found files
+            Sorted list of Path objects for found files
         """
-        found_files = []
+        return sorted(self.iter_files())
 
-        if not self.input_dir.exists():
-            print(f"Warning: Input directory '{self.input_dir}' does not exist.")
-            return found_files
+    def _load_cache(self) -> Dict[Tuple, Tuple[str, bool]]:
+        """
+        Load the extraction cache saved by an earlier run.
+
+        Returns:
+            Cache dictionary (empty if there is no usable cache file)
+        """
+        try:
+            data = self._cache_path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            logger.warning("Could not read extraction cache: %s", e)
+            return {}
+
+        try:
+            if data[:4] == _ZSTD_MAGIC:
+                if zstandard is None:
+                    logger.warning("Extraction cache is compressed, but zstandard is not installed")
+                    return {}
+                data = zstandard.ZstdDecompressor().decompress(data)
+            entries = json.loads(data)
+
+            # Plain data only (the file may come with a downloaded corpus): entries
+            # are [[path, mtime_ns, size, fast_text_only], [text, success]]
+            cache = {}
+            for (path, mtime_ns, size, fast), (text, success) in entries:
+                if not (isinstance(path, str) and type(mtime_ns) is int and type(size) is int
+                        and isinstance(fast, bool) and isinstance(text, str) and isinstance(success, bool)):
+                    raise ValueError("unexpected entry type")
+                cache[(path, mtime_ns, size, fast)] = (text, success)
+        except Exception as e:
+            logger.warning("Could not load extraction cache: %s", e)
+            return {}
+
+        return cache
+
+    def save_cache(self):
+        """
+        Save the extraction cache to the input directory.
+
+        Only entries used in this run are kept, so results for deleted or
+        modified files do not accumulate. Compressed with zstandard if installed.
+        """
+        if self._cache is None:
+            return
+        if not self._cache_dirty and len(self._cache_used) == len(self._cache):
+            return
+
+        entries = {key: self._cache[key] for key in self._cache_used}
+        data = json.dumps([[list(key), list(result)] for key, result in entries.items()]).encode('utf-8')
+        if zstandard is not None:
+            data = zstandard.ZstdCompressor().compress(data)
+
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.input_dir, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, self._cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Could not write extraction cache: %s", e)
+            return
+
+        self._cache = entries
+        self._cache_dirty = False
+
+    def _cache_key(self, file_path: Path) -> Optional[Tuple]:
+        """
+        Build the extraction cache key of a file.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Cache key, or None if caching is disabled or the file cannot be stat'ed
+        """
+        if self._cache is None:
+            return None
+
+        path = str(file_path)
+        st = self._stat_cache.pop(path, None)
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size, self.fast_text_only)
+
+    def _cache_get(self, key: Optional[Tuple]) -> Optional[Tuple[str, bool]]:
+        """Look up a cached extraction result."""
+        if key is None:
+            return None
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache_used.add(key)
+        return result
+
+    def _cache_put(self, key: Optional[Tuple], result: Tuple[str, bool]):
+        """Store a successful extraction result in the cache."""
+        if key is not None and result[1]:
+            self._cache[key] = result
+            self._cache_used.add(key)
+            self._cache_dirty = True
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """Return the constructor options extraction worker processes need."""
+        return {'fast_text_only': self.fast_text_only, 'skip_scanned': self.skip_scanned}
 
-        for file_type in self.file_types:
-            # Use rglob for recursive search
-            pattern = f"**/*.{file_type}"
-            files = list(self.input_dir.rglob(pattern))
-            found_files.extend(files)
+    def _iter_page_texts(self, pdf_path: Path, start: int = 0, stop: Optional[int] = None) -> Iterator[Optional[str]]:
+        """
+        Yield the raw text of each page of a PDF.
+
+        Args:
+            pdf_path: Path to the PDF file
+            start: Index of the first page
+            stop: Index after the last page (None for the end of the document)
+
+        Yields:
+            Page text (None or empty for pages without text)
+        """
+        if self.fast_text_only:
+            yield from _iter_pdfminer_page_texts(pdf_path, start, stop, self.skip_scanned)
+            return
+
+        with _open_pdf(pdf_path) as pdf:
+            for page in pdf.pages[start:stop]:
+                if self.skip_scanned and not _has_font_resources(page.page_obj.resources):
+                    yield None
+                else:
+                    yield page.extract_text()
+
+                # pdfplumber keeps every page's parsed objects until the document is
+                # closed; drop them once the page is done so memory stays flat
+                page.flush_cache()
+                page.get_textmap.cache_clear()
+
+    def iter_pages_text(self, pdf_path: Path, chunk: int = 50) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the text of a PDF page by page, for streaming large documents.
+
+        Only the pages currently being processed are held in memory, so the
+        caller can feed each page on without collecting the whole document.
+
+        Args:
+            pdf_path: Path to the PDF file
+            chunk: In fast_text_only mode, pdfminer's font and resource cache is
+                dropped every this many pages (pdfplumber pages are released one at a time)
 
-        # Remove duplicates and sort
-        found_files = sorted(set(found_files))
+        Yields:
+            Tuples of (page_number, page_text); page_text is empty for pages without text
+        """
+        if self.fast_text_only:
+            page_texts = _iter_pdfminer_page_texts(pdf_path, skip_scanned=self.skip_scanned, chunk=chunk)
+        else:
+            page_texts = self._iter_page_texts(pdf_path)
 
-        return found_files
+        for page_num, page_text in enumerate(page_texts, 1):
+            yield page_num, page_text or ""
 
     def extract_text_from_pdf(self, pdf_path: Path) -> Tuple[str, bool]:
         """
@@ -52,30 +527,254 @@ class PDFProcessor:
         Returns:
             Tuple of (extracted_text, success_flag)
         """
+        key = self._cache_key(pdf_path)
+        result = self._cache_get(key)
+        if result is None:
+            result = self._extract_text_from_pdf_uncached(pdf_path)
+            self._cache_put(key, result)
+        return result
+
+    def _extract_text_from_pdf_uncached(self, pdf_path: Path) -> Tuple[str, bool]:
+        """Extract text content from a PDF file, bypassing the extraction cache."""
         try:
-            text_content = []
+            full_text = _join_pages(list(self._iter_page_texts(pdf_path)))
 
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages, 1):
-                    # Extract text from page
-                    page_text = page.extract_text()
+            if not full_text.strip():
+                return "", False
 
-                    if page_text:
-                        text_content.append(f"--- Page {page_num} ---\n{page_text}")
-                    else:
-                        text_content.append(f"--- Page {page_num} ---\n[No extractable text]")
+            return full_text, True
+
+        except Exception as e:
+            logger.error("Could not extract text from %s: %s", pdf_path.name, e)
+            return "", False
+
+    def extract_text_to_file(self, pdf_path: Path, out_path: Path) -> bool:
+        """
+        Extract text content from a PDF file and write it straight to a UTF-8 file.
 
-            full_text = "\n\n".join(text_content)
+        Produces the same text as extract_text_from_pdf(), but each page is
+        encoded once and written as it is extracted, so the whole document is
+        never held in memory as a single string.
+
+        Args:
+            pdf_path: Path to the PDF file
+            out_path: Path of the text file to write
+
+        Returns:
+            True if successful, False otherwise (as extract_text_from_pdf(), also
+            when the document has no text); out_path is then left untouched
+        """
+        # Written under a temporary name, so a failure never leaves a partial file
+        tmp_path = out_path.with_name(out_path.name + '.part')
+        try:
+            page_num = 0
+            with open(tmp_path, 'wb') as f:
+                for page_num, page_text in enumerate(self._iter_page_texts(pdf_path), 1):
+                    if page_num > 1:
+                        f.write(_PAGE_SEPARATOR_BYTES)
+                    f.write(_PAGE_HEADER_BYTES % page_num)
+                    f.write(page_text.encode('utf-8', 'replace') if page_text else _NO_TEXT_BYTES)
+
+            if page_num == 0:
+                os.unlink(tmp_path)
+                return False
+
+            os.replace(tmp_path, out_path)
+            return True
+
+        except Exception as e:
+            logger.error("Could not extract text from %s: %s", pdf_path.name, e)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return False
+
+    def extract_text_from_pdf_parallel(self, pdf_path: Path, num_workers: int = DEFAULT_WORKERS) -> Tuple[str, bool]:
+        """
+        Extract text content from a single large PDF, splitting its pages across processes.
+
+        Args:
+            pdf_path: Path to the PDF file
+            num_workers: Number of worker processes
+
+        Returns:
+            Tuple of (extracted_text, success_flag)
+        """
+        try:
+            with _open_pdf(pdf_path) as pdf:
+                page_count = len(pdf.pages)
+
+            num_workers = max(1, min(num_workers, page_count))
+            if num_workers == 1:
+                return self._extract_text_from_pdf_uncached(pdf_path)
+
+            # One contiguous page range per worker, so each opens the file only once
+            step = -(-page_count // num_workers)
+            ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+
+            with process_pool(num_workers) as executor:
+                futures = [executor.submit(_extract_page_range_worker, pdf_path, start, stop, self._worker_options())
+                           for start, stop in ranges]
+                page_texts = [text for future in futures for text in future.result()]
+
+            full_text = _join_pages(page_texts)
 
             if not full_text.strip():
                 return "", False
 
             return full_text, True
 
+        except BrokenProcessPool as e:
+            logger.warning("Extraction process crashed for %s (%s), retrying in-process", pdf_path.name, e)
+            return self._extract_text_from_pdf_uncached(pdf_path)
         except Exception as e:
-            print(f"Error extracting text from {pdf_path.name}: {str(e)}")
+            logger.error("Could not extract text from %s: %s", pdf_path.name, e)
             return "", False
 
+    def extract_many(self, paths: Iterable[Path], num_workers: int = DEFAULT_WORKERS) -> Dict[Path, Tuple[str, bool]]:
+        """
+        Get the content of many files, extracting PDFs in parallel worker processes.
+
+        PDFs are submitted as soon as they are read from paths, so passing
+        iter_files() overlaps extraction with the directory walk.
+
+        Callers must be importable without side effects (guard the entry point
+        with ``if __name__ == "__main__":``), since worker processes may
+        re-import the main module.
+
+        Args:
+            paths: Paths (or an iterator of paths) of the files to read
+            num_workers: Number of worker processes
+
+        Returns:
+            Dictionary mapping each path to a (content, success_flag) tuple
+        """
+        results = {}
+        pdf_paths = []
+        futures = {}
+        cache_keys = {}
+        options = self._worker_options()
+        paths = iter(paths)
+
+        def collect(path: Path) -> bool:
+            """Read a non-PDF or cached file into results; return True for a PDF to extract."""
+            if path.suffix.lower() != self._pdf_ext:
+                results[path] = self.get_file_content(path)
+                return False
+
+            key = self._cache_key(path)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[path] = cached
+                return False
+
+            cache_keys[path] = key
+            pdf_paths.append(path)
+            return True
+
+        pool_broken = False
+        try:
+            # The pool only starts worker processes once work is submitted
+            with process_pool(max(1, num_workers)) as executor:
+                for path in paths:
+                    if not collect(path) or num_workers <= 1:
+                        continue
+
+                    # Hold back the first PDF: if it is the only one, its pages are
+                    # split across the workers instead
+                    if len(pdf_paths) == 2:
+                        futures[executor.submit(_extract_pdf_worker, pdf_paths[0], options)] = pdf_paths[0]
+                    if len(pdf_paths) >= 2:
+                        futures[executor.submit(_extract_pdf_worker, path, options)] = path
+
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+        except BrokenProcessPool as e:
+            logger.warning("Extraction process crashed (%s), extracting remaining files in-process", e)
+            pool_broken = True
+            # The crash may have interrupted the walk; read the rest of it too
+            for path in paths:
+                collect(path)
+
+        if len(pdf_paths) == 1 and num_workers > 1 and not pool_broken:
+            results[pdf_paths[0]] = self.extract_text_from_pdf_parallel(pdf_paths[0], num_workers)
+
+        # Serial extraction (single worker, or files left over by a crashed pool)
+        for path in pdf_paths:
+            if path not in results:
+                results[path] = self._extract_text_from_pdf_uncached(path)
+            self._cache_put(cache_keys[path], results[path])
+
+        return results
+
+    async def extract_text_from_pdf_async(self, pdf_path: Path, executor: Optional[Executor] = None) -> Tuple[str, bool]:
+        """
+        Extract text content from a PDF file without blocking the event loop.
+
+        Args:
+            pdf_path: Path to the PDF file
+            executor: Process pool to run the extraction in (a worker thread if None)
+
+        Returns:
+            Tuple of (extracted_text, success_flag)
+        """
+        key = self._cache_key(pdf_path)
+        result = self._cache_get(key)
+        if result is not None:
+            return result
+
+        if executor is not None:
+            try:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(executor, _extract_pdf_worker, pdf_path, self._worker_options())
+            except BrokenProcessPool as e:
+                logger.warning("Extraction process crashed for %s (%s), retrying in-process", pdf_path.name, e)
+
+        if result is None:
+            result = await asyncio.to_thread(self._extract_text_from_pdf_uncached, pdf_path)
+
+        self._cache_put(key, result)
+        return result
+
+    async def get_file_content_async(self, file_path: Path, executor: Optional[Executor] = None) -> Tuple[str, bool]:
+        """
+        Get content from a file based on its type, without blocking the event loop.
+
+        Args:
+            file_path: Path to the file
+            executor: Process pool for PDF extraction (a worker thread if None)
+
+        Returns:
+            Tuple of (content, success_flag)
+        """
+        if file_path.suffix.lower() == self._pdf_ext:
+            return await self.extract_text_from_pdf_async(file_path, executor)
+        return await asyncio.to_thread(self.get_file_content, file_path)
+
+    async def extract_many_async(self, paths: Iterable[Path], concurrency: int = 8,
+                                 executor: Optional[Executor] = None) -> Dict[Path, Tuple[str, bool]]:
+        """
+        Get the content of many files concurrently, overlapping disk reads with parsing.
+
+        Args:
+            paths: Paths of the files to read
+            concurrency: Maximum number of files being read at once
+            executor: Process pool for PDF extraction (worker threads if None)
+
+        Returns:
+            Dictionary mapping each path to a (content, success_flag) tuple
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def read(path: Path) -> Tuple[str, bool]:
+            async with semaphore:
+                return await self.get_file_content_async(path, executor)
+
+        paths = list(paths)
+        results = await asyncio.gather(*(read(path) for path in paths))
+        return dict(zip(paths, results))
+
     def read_text_file(self, file_path: Path) -> Tuple[str, bool]:
         """
         Read content from a text file.
@@ -87,11 +786,19 @@ class PDFProcessor:
             Tuple of (file_content, success_flag)
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if file_path.stat().st_size > MMAP_THRESHOLD:
+                # Decode large files straight from the page cache instead of copying them first
+                with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content = codecs.decode(mapped, 'utf-8', 'replace')
+            else:
+                content = file_path.read_bytes().decode('utf-8', errors='replace')
+
+            # Same line endings as text mode (universal newlines)
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             return content, True
         except Exception as e:
-            print(f"Error reading file {file_path.name}: {str(e)}")
+            logger.error("Could not read file %s: %s", file_path.name, e)
             return "", False
 
     def get_file_content(self, file_path: Path) -> Tuple[str, bool]:
@@ -104,16 +811,15 @@ class PDFProcessor:
         Returns:
             Tuple of (content, success_flag)
         """
-        extension = file_path.suffix.lower().strip('.')
+        extension = file_path.suffix.lower()
 
-        if extension == 'pdf':
-            return self.extract_text_from_pdf(file_path)
-        elif extension in ['txt', 'md', 'tex']:
-            return self.read_text_file(file_path)
-        else:
-            print(f"Unsupported file type: {extension}")
+        handler = self._handlers.get(extension)
+        if handler is None:
+            logger.warning("Unsupported file type: %s", extension[1:])
             return "", False
 
+        return handler(file_path)
+
     def get_relative_path(self, file_path: Path) -> str:
         """
         Get relative path of file from input directory.
@@ -124,6 +830,10 @@ class PDFProcessor:
         Returns:
             Relative path as string
         """
+        path = str(file_path)
+        if path.startswith(self._input_prefix):
+            return path[len(self._input_prefix):]
+
         try:
             return str(file_path.relative_to(self.input_dir))
         except ValueError:
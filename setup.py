@@ -0,0 +1,19 @@
+"""
+Optional build script that compiles pdf_processor.py with Cython.
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+When the compiled extension (pdf_processor.*.so / .pyd) sits next to
+pdf_processor.py, Python imports it instead of the source file. Delete
+it to go back to the pure-Python module.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+
+setup(
+    name="pdf-translator-summarizer",
+    ext_modules=cythonize("pdf_processor.py", language_level=3),
+)
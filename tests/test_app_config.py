@@ -0,0 +1,67 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app_config import AppConfig, ConfigError  # noqa: E402
+
+
+def _config(**sections):
+    data = {
+        'api': {'base_url': "http://llm.test/v1", 'api_key': "key", 'model': "model"},
+        'processing': {'mode': "translate"},
+        'paths': {'input_dir': "papers"},
+        'prompts': {'translation': "Translate to {output_language}: {content}"},
+    }
+    for name, values in sections.items():
+        data.setdefault(name, {}).update(values)
+    return data
+
+
+def test_from_dict_applies_defaults():
+    cfg = AppConfig.from_dict(_config())
+    assert cfg.advanced.chunk_chars == 6000
+    assert cfg.advanced.retry.max_attempts == 6
+    assert cfg.processing.output_format == 'docx'
+
+
+def test_from_dict_reports_missing_key():
+    data = _config()
+    del data['api']['model']
+    with pytest.raises(ConfigError, match="api.model"):
+        AppConfig.from_dict(data)
+
+
+def test_from_dict_requires_prompt_of_enabled_task():
+    with pytest.raises(ConfigError, match="prompts.summarization"):
+        AppConfig.from_dict(_config(processing={'mode': "both"}))
+
+
+@pytest.mark.parametrize("section, values, name", [
+    ('advanced', {'max_concurrency': "4"}, "advanced.max_concurrency"),
+    ('advanced', {'max_tokens': True}, "advanced.max_tokens"),
+    ('advanced', {'show_progress': "yes"}, "advanced.show_progress"),
+    ('advanced', {'retry': {'max_wait': "60"}}, "advanced.retry.max_wait"),
+    ('processing', {'output_format': 5}, "processing.output_format"),
+])
+def test_from_dict_rejects_wrong_types(section, values, name):
+    with pytest.raises(ConfigError, match=name):
+        AppConfig.from_dict(_config(**{section: values}))
+
+
+def test_from_dict_accepts_int_for_float():
+    cfg = AppConfig.from_dict(_config(advanced={'temperature': 0}))
+    assert cfg.advanced.temperature == 0.0 and isinstance(cfg.advanced.temperature, float)
+
+
+def test_from_dict_rejects_out_of_range_value():
+    with pytest.raises(ConfigError, match="advanced.max_concurrency"):
+        AppConfig.from_dict(_config(advanced={'max_concurrency': 0}))
+
+
+def test_from_dict_warns_about_unknown_keys(capsys):
+    cfg = AppConfig.from_dict(_config(advanced={'no_such_key': 1}))
+    assert cfg.advanced.max_concurrency == 4
+    assert "advanced.no_such_key" in capsys.readouterr().out
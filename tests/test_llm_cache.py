@@ -0,0 +1,52 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_cache import LLMCache, SemanticCache  # noqa: E402
+
+np = pytest.importorskip("numpy")
+
+
+def _semantic_cache(cache_dir):
+    store = LLMCache(cache_dir=str(cache_dir))
+    return store, SemanticCache(store, similarity_threshold=0.9)
+
+
+def test_semantic_cache_persists_appended_entries(tmp_path):
+    store, cache = _semantic_cache(tmp_path)
+    for i in range(40):
+        key = f"key{i}"
+        store.set(key, f"response {i}")
+        cache.add("translate:French", np.eye(64)[i], key)
+
+    # Hits on rows added in this process
+    assert cache.lookup("translate:French", np.eye(64)[3]) == "response 3"
+
+    # A fresh instance reads the appended rows back from disk
+    _, reloaded = _semantic_cache(tmp_path)
+    assert reloaded.lookup("translate:French", np.eye(64)[39]) == "response 39"
+    assert reloaded.lookup("translate:French", np.eye(64)[50]) is None
+    assert reloaded.lookup("summarize:French", np.eye(64)[3]) is None
+
+
+def test_semantic_cache_drops_interrupted_append(tmp_path):
+    store, cache = _semantic_cache(tmp_path)
+    store.set("key0", "response 0")
+    cache.add("scope", np.eye(8)[0], "key0")
+
+    # Simulate a crash after the vector row was written but before its key
+    vectors_path, _ = cache._index_paths("scope", 8)
+    with open(vectors_path, 'ab') as f:
+        f.write(np.eye(8, dtype=np.float32)[1].tobytes())
+
+    store, reloaded = _semantic_cache(tmp_path)
+    store.set("key2", "response 2")
+    reloaded.add("scope", np.eye(8)[2], "key2")
+    assert reloaded.lookup("scope", np.eye(8)[0]) == "response 0"
+    assert reloaded.lookup("scope", np.eye(8)[1]) is None
+
+    _, again = _semantic_cache(tmp_path)
+    assert again.lookup("scope", np.eye(8)[2]) == "response 2"
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import os
+import sys
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_cache import LLMCache, SemanticCache  # noqa: E402
+from llm_client import LLMClient, _split_prompt_template, format_prompt, split_into_chunks  # noqa: E402
+
+
+@pytest.mark.parametrize("template", [
+    "Translate to {output_language}:\n\n{content}",
+    "{{literal braces}} {content} in {output_language!r}",
+    "{content} / {content} ({output_language:>10})",
+    "No placeholders at all",
+    "{output_language!s}: {content!r}",  # conversion on {content}: str.format fallback
+    "{content:.5}",  # format spec on {content}: str.format fallback
+])
+def test_format_prompt_matches_str_format(template):
+    content = "Body with {braces} and 'quotes'"
+    expected = template.format(content=content, output_language="French")
+    assert format_prompt(template, content, "French") == expected
+
+
+def test_split_prompt_template_falls_back_only_for_unhandled_fields():
+    assert _split_prompt_template("{{x}} {content} {output_language!r} {content}", "French") == ("{x} ", " 'French' ", "")
+    assert _split_prompt_template("{content!r}", "French") is None
+    assert _split_prompt_template("{content:>5}", "French") is None
+    assert _split_prompt_template("{other}", "French") is None
+
+
+def test_format_prompt_rejects_unknown_fields_like_str_format():
+    with pytest.raises(KeyError):
+        format_prompt("{content} {unknown}", "text", "French")
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 7, 40, 200, 10000])
+def test_split_into_chunks_bounds_size_and_keeps_text(chunk_chars):
+    content = "\n\n".join([
+        "Short paragraph.",
+        "A longer paragraph. It has several sentences! Does it split? Yes, on sentence boundaries.",
+        "x" * 95,
+        "   \n",
+        "Last one.",
+    ])
+    chunks = split_into_chunks(content, chunk_chars)
+
+    assert all(0 < len(chunk) <= chunk_chars for chunk in chunks)
+    # Only whitespace between pieces may change
+    assert "".join("".join(chunks).split()) == "".join(content.split())
+
+
+def test_split_into_chunks_keeps_fitting_paragraphs_whole():
+    paragraphs = ["First paragraph here.", "Second one.", "Third paragraph, a bit longer."]
+    chunks = split_into_chunks("\n\n".join(paragraphs), 40)
+    assert chunks == ["First paragraph here.\n\nSecond one.", "Third paragraph, a bit longer."]
+
+
+def _completion(text):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "test-model",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": text},
+            "finish_reason": "stop",
+        }],
+    }
+
+
+def _chunk(text):
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "test-model",
+        "choices": [{"index": 0, "delta": {"content": text}, "finish_reason": None}],
+    }
+
+
+def _make_client(handler, **kwargs):
+    """Build an LLMClient whose async requests are answered by handler."""
+    client = LLMClient(base_url="http://llm.test/v1", api_key="test-key", model="test-model",
+                       retry_max_attempts=3, retry_max_wait=0, **kwargs)
+    client._async_http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client.async_client = AsyncOpenAI(base_url="http://llm.test/v1", api_key="test-key",
+                                      http_client=client._async_http, max_retries=0)
+    return client
+
+
+def test_acall_llm_retries_transient_errors():
+    calls = []
+
+    def handler(request):
+        calls.append(json.loads(request.content))
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"retry-after": "0"}, json={"error": {"message": "busy"}})
+        return httpx.Response(200, json=_completion("Bonjour"))
+
+    async def run():
+        client = _make_client(handler)
+        try:
+            return await client._acall_llm("Translate: Hello")
+        finally:
+            await client.aclose()
+            client.close()
+
+    assert asyncio.run(run()) == "Bonjour"
+    assert len(calls) == 2
+    assert calls[0]["messages"] == [{"role": "user", "content": "Translate: Hello"}]
+
+
+def test_astream_yields_deltas():
+    def handler(request):
+        assert json.loads(request.content)["stream"] is True
+        body = "".join(f"data: {json.dumps(_chunk(text))}\n\n" for text in ("Bon", "jour"))
+        body += "data: [DONE]\n\n"
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body.encode())
+
+    async def run():
+        client = _make_client(handler)
+        try:
+            return [delta async for delta in client.astream("Hello", "Translate to {output_language}: {content}", "French")]
+        finally:
+            await client.aclose()
+            client.close()
+
+    assert asyncio.run(run()) == ["Bon", "jour"]
+
+
+def test_acall_llm_answers_similar_request_from_semantic_cache(tmp_path):
+    pytest.importorskip("numpy")
+    completions = []
+
+    def handler(request):
+        if request.url.path.endswith("/embeddings"):
+            return httpx.Response(200, json={
+                "object": "list",
+                "model": "test-embedding",
+                "data": [{"object": "embedding", "index": 0, "embedding": [1.0, 0.0, 0.0]}],
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            })
+        completions.append(request)
+        return httpx.Response(200, json=_completion("Bonjour"))
+
+    async def run():
+        store = LLMCache(cache_dir=str(tmp_path))
+        client = _make_client(handler, temperature=0, cache=store, semantic_cache=SemanticCache(store))
+        try:
+            first = await client._acall_llm("Translate: Hello", cache_scope="translate", cache_content="Hello")
+            second = await client._acall_llm("Translate: Hello!", cache_scope="translate", cache_content="Hello!")
+            return first, second
+        finally:
+            await client.aclose()
+            client.close()
+
+    assert asyncio.run(run()) == ("Bonjour", "Bonjour")
+    assert len(completions) == 1
+
+
+def test_chunked_translation_respects_request_limit():
+    in_flight = []
+    peak = []
+
+    async def handler(request):
+        in_flight.append(request)
+        peak.append(len(in_flight))
+        await asyncio.sleep(0.01)
+        in_flight.pop()
+        return httpx.Response(200, json=_completion("ok"))
+
+    async def run():
+        client = _make_client(handler, max_concurrent_requests=2)
+        try:
+            content = "\n\n".join(f"Paragraph {i}." for i in range(10))
+            return await client.atranslate_chunked(content, "{content}", "French", chunk_chars=15)
+        finally:
+            await client.aclose()
+            client.close()
+
+    assert asyncio.run(run()) == "\n\n".join(["ok"] * 10)
+    assert len(peak) == 10
+    assert max(peak) == 2
@@ -0,0 +1,16 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from output_writer import OutputWriter  # noqa: E402
+
+
+def test_escape_tex_escapes_every_special_character_once():
+    assert OutputWriter._escape_tex(r"50% of $x_1$ & {a} #2 ~ ^ \ ") == (
+        r"50\% of \$x\_1\$ \& \{a\} \#2 \textasciitilde{} \textasciicircum{} \textbackslash{} "
+    )
+
+
+def test_escape_tex_leaves_plain_text_alone():
+    assert OutputWriter._escape_tex("Plain text, unicode: é ß 中文.") == "Plain text, unicode: é ß 中文."
@@ -0,0 +1,66 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pdf_processor  # noqa: E402
+from pdf_processor import CACHE_FILENAME, PDFProcessor, _join_pages  # noqa: E402
+
+
+def test_join_pages_numbers_pages_and_fills_empty_ones():
+    assert _join_pages(["one", None, ""]) == (
+        "--- Page 1 ---\none\n\n"
+        "--- Page 2 ---\n[No extractable text]\n\n"
+        "--- Page 3 ---\n[No extractable text]"
+    )
+
+
+def test_extraction_cache_round_trip(tmp_path):
+    pdf = tmp_path / "paper.pdf"
+    pdf.write_bytes(b"%PDF-1.4 placeholder")
+
+    processor = PDFProcessor(str(tmp_path), ['pdf'], extraction_cache=True)
+    key = processor._cache_key(pdf)
+    processor._cache_put(key, ("cached text", True))
+    processor.save_cache()
+
+    reloaded = PDFProcessor(str(tmp_path), ['pdf'], extraction_cache=True)
+    assert reloaded.extract_text_from_pdf(pdf) == ("cached text", True)
+
+
+def test_extraction_cache_ignores_unexpected_data(tmp_path, monkeypatch):
+    # zstd-compressed files are only written when zstandard is installed
+    monkeypatch.setattr(pdf_processor, "zstandard", None)
+    (tmp_path / CACHE_FILENAME).write_text('[[["a.pdf", 1, 2, false], [{"not": "text"}, true]]]')
+
+    processor = PDFProcessor(str(tmp_path), ['pdf'], extraction_cache=True)
+    assert processor._cache == {}
+
+
+def test_extract_text_to_file_writes_pages(tmp_path, monkeypatch):
+    processor = PDFProcessor(str(tmp_path), ['pdf'])
+    monkeypatch.setattr(processor.__class__, "_iter_page_texts", lambda self, path: iter(["one", None]))
+
+    out_path = tmp_path / "out.txt"
+    assert processor.extract_text_to_file(tmp_path / "paper.pdf", out_path)
+    assert out_path.read_text(encoding='utf-8') == _join_pages(["one", None])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.txt"]
+
+
+def test_extract_text_to_file_leaves_nothing_behind_on_failure(tmp_path, monkeypatch):
+    def failing_pages(self, path):
+        yield "one"
+        raise ValueError("broken page")
+
+    processor = PDFProcessor(str(tmp_path), ['pdf'])
+    out_path = tmp_path / "out.txt"
+
+    monkeypatch.setattr(processor.__class__, "_iter_page_texts", failing_pages)
+    assert not processor.extract_text_to_file(tmp_path / "paper.pdf", out_path)
+
+    # A document without pages fails like extract_text_from_pdf() does
+    monkeypatch.setattr(processor.__class__, "_iter_page_texts", lambda self, path: iter([]))
+    assert not processor.extract_text_to_file(tmp_path / "paper.pdf", out_path)
+    assert processor._extract_text_from_pdf_uncached(tmp_path / "paper.pdf") == ("", False)
+
+    assert list(tmp_path.iterdir()) == []